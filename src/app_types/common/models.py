@@ -5,11 +5,28 @@ These provide common fields and methods that all business-specific models inheri
 Each app type (salon, clinic, gym) extends these with their specific fields.
 """
 from django.db import models
+from django.db.models import F, Q
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from tenants_core.core.models import TenantAwareModel
 
 
+class BookingStatus(models.IntegerChoices):
+    """
+    Booking lifecycle states.
+
+    Stored as a smallint (2 bytes) rather than a short string; ``BaseBooking.status_code``
+    gives back the old string form for serializers and external callers.
+    """
+    PENDING = 1, _('Pending')
+    CONFIRMED = 2, _('Confirmed')
+    CHECKED_IN = 3, _('Checked In')
+    IN_PROGRESS = 4, _('In Progress')
+    COMPLETED = 5, _('Completed')
+    CANCELLED = 6, _('Cancelled')
+    NO_SHOW = 7, _('No Show')
+
+
 class BaseBooking(TenantAwareModel):
     """
     Abstract base for all booking/appointment models.
@@ -38,17 +55,11 @@ class BaseBooking(TenantAwareModel):
     )
 
     # Status tracking
-    class Status(models.TextChoices):
-        PENDING = 'pending', _('Pending')
-        CONFIRMED = 'confirmed', _('Confirmed')
-        CHECKED_IN = 'checked_in', _('Checked In')
-        IN_PROGRESS = 'in_progress', _('In Progress')
-        COMPLETED = 'completed', _('Completed')
-        CANCELLED = 'cancelled', _('Cancelled')
-        NO_SHOW = 'no_show', _('No Show')
-
-    status = models.CharField(
-        max_length=20,
+    Status = BookingStatus
+
+    _CANCELLABLE_STATUSES = frozenset({Status.PENDING.value, Status.CONFIRMED.value})
+
+    status = models.PositiveSmallIntegerField(
         choices=Status.choices,
         default=Status.PENDING
     )
@@ -78,10 +89,38 @@ class BaseBooking(TenantAwareModel):
         indexes = [
             models.Index(fields=['booking_date', 'start_time']),
             models.Index(fields=['status']),
+            models.Index(fields=['customer', 'booking_date']),
+            models.Index(fields=['status', 'booking_date', 'start_time']),
+            # Calendar views only ever look at bookings that are still open
+            models.Index(
+                fields=['booking_date', 'start_time'],
+                condition=Q(status__in=[
+                    BookingStatus.PENDING,
+                    BookingStatus.CONFIRMED,
+                    BookingStatus.CHECKED_IN,
+                    BookingStatus.IN_PROGRESS,
+                ]),
+                name='%(class)s_active_idx',
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=Q(end_time__gt=F('start_time')),
+                name='%(app_label)s_%(class)s_time_order',
+            ),
+            models.CheckConstraint(
+                check=Q(status__in=BookingStatus.values),
+                name='%(app_label)s_%(class)s_status_valid',
+            ),
         ]
 
     def clean(self):
-        """Validate booking times."""
+        """
+        Validate booking times.
+
+        The ordering itself is enforced by the ``time_order`` check constraint;
+        this only turns it into a field error for forms.
+        """
         super().clean()
         if self.start_time and self.end_time:
             if self.start_time >= self.end_time:
@@ -92,18 +131,20 @@ class BaseBooking(TenantAwareModel):
     def get_duration_minutes(self):
         """Calculate booking duration in minutes."""
         if self.start_time and self.end_time:
-            from datetime import datetime, timedelta
-            start = datetime.combine(self.booking_date, self.start_time)
-            end = datetime.combine(self.booking_date, self.end_time)
-            return int((end - start).total_seconds() / 60)
+            # Both times fall on booking_date, so plain clock arithmetic is enough
+            s, e = self.start_time, self.end_time
+            seconds = (e.hour - s.hour) * 3600 + (e.minute - s.minute) * 60 + (e.second - s.second)
+            return int(seconds / 60)
         return 0
 
+    @property
+    def status_code(self):
+        """Status as its string code ('pending', 'checked_in', ...)."""
+        return self.Status(self.status).name.lower()
+
     def can_cancel(self):
         """Check if booking can be cancelled."""
-        return self.status in [
-            self.Status.PENDING,
-            self.Status.CONFIRMED
-        ]
+        return self.status in self._CANCELLABLE_STATUSES
 
     def __str__(self):
         return f"{self.customer} - {self.booking_date} {self.start_time}"
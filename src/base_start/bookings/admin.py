@@ -1,17 +1,39 @@
 """Booking admin."""
 from django.contrib import admin
 
+from app_types.common.models import BaseBooking
+from tenants_core.core.admin_mixins import ChangelistOnlyMixin
+
 from .models import Booking, BookingEvent
 
 
+class StatusFilter(admin.SimpleListFilter):
+    """Status filter built from the fixed booking statuses instead of SELECT DISTINCT."""
+
+    title = "status"
+    parameter_name = "status"
+
+    def lookups(self, request, model_admin):
+        # Booking.status stores the string codes, BaseBooking.Status the smallint ones
+        return [(status.name.lower(), status.label) for status in BaseBooking.Status]
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        return queryset.filter(status=value) if value else queryset
+
+
 @admin.register(Booking)
-class BookingAdmin(admin.ModelAdmin):
+class BookingAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ["booking_ref", "customer_id", "staff_id", "start_time", "status", "created_at"]
-    list_filter = ["status", "channel"]
+    list_filter = [StatusFilter, "channel"]
     search_fields = ["booking_ref", "customer_id", "staff_id"]
+    changelist_only_fields = (
+        "id", "booking_ref", "customer_id", "staff_id", "start_time", "status", "channel", "created_at",
+    )
 
 
 @admin.register(BookingEvent)
 class BookingEventAdmin(admin.ModelAdmin):
     list_display = ["booking", "event_type", "created_at"]
     list_filter = ["event_type"]
+    list_select_related = ["booking"]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:24
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('bookings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='customer_id',
+            field=models.UUIDField(),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='staff_id',
+            field=models.UUIDField(),
+        ),
+        AddIndexConcurrently(
+            model_name='booking',
+            index=models.Index(fields=['staff_id', 'start_time'], name='bookings_bo_staff_i_9aeb4c_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='booking',
+            index=models.Index(fields=['customer_id', 'start_time'], name='bookings_bo_custome_b686e7_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'confirmed'])), fields=['status', 'start_time'], name='bkg_open_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:25
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('bookings', '0002_booking_composite_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='booking',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['snapshot'], name='booking_snapshot_gin', opclasses=['jsonb_path_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='booking',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['metadata'], name='booking_meta_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
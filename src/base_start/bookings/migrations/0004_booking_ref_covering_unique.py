@@ -0,0 +1,22 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0003_jsonb_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.UniqueConstraint(fields=('booking_ref',), include=('customer_id', 'staff_id', 'start_time', 'status', 'created_at'), name='bkg_ref_uniq'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='booking_ref',
+            field=models.CharField(max_length=50),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:28
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('bookings', '0004_booking_ref_covering_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='bookingevent',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        AddIndexConcurrently(
+            model_name='bookingevent',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='bookingevent_created_brin', pages_per_range=32),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0005_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='snapshot',
+            field=models.JSONField(db_default={}, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='bookingevent',
+            name='payload',
+            field=models.JSONField(db_default={}, default=dict),
+        ),
+    ]
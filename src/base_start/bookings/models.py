@@ -1,5 +1,7 @@
 """Booking models."""
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 from django.db import models
+from django.db.models import Q
 
 from tenants_core.core.models import TenantAwareModel
 
@@ -7,19 +9,38 @@ from tenants_core.core.models import TenantAwareModel
 class Booking(TenantAwareModel):
     """Booking model."""
 
-    customer_id = models.UUIDField(db_index=True)
-    staff_id = models.UUIDField(db_index=True)
+    customer_id = models.UUIDField()
+    staff_id = models.UUIDField()
     service_id = models.UUIDField(db_index=True)
-    booking_ref = models.CharField(max_length=50, unique=True)
+    booking_ref = models.CharField(max_length=50)
     start_time = models.DateTimeField(db_index=True)
     end_time = models.DateTimeField()
     status = models.CharField(max_length=50, db_index=True)
     channel = models.CharField(max_length=50)
-    snapshot = models.JSONField(default=dict)
+    snapshot = models.JSONField(default=dict, db_default={})
     metadata = models.JSONField(default=dict, blank=True)
 
     class Meta:
         db_table = "bookings_booking"
+        indexes = [
+            models.Index(fields=["staff_id", "start_time"]),
+            models.Index(fields=["customer_id", "start_time"]),
+            models.Index(
+                fields=["status", "start_time"],
+                condition=Q(status__in=["pending", "confirmed"]),
+                name="bkg_open_idx",
+            ),
+            GinIndex(fields=["snapshot"], name="booking_snapshot_gin", opclasses=["jsonb_path_ops"]),
+            GinIndex(fields=["metadata"], name="booking_meta_gin", opclasses=["jsonb_path_ops"]),
+        ]
+        constraints = [
+            # Covering index: lookups by ref can be answered from the index alone
+            models.UniqueConstraint(
+                fields=["booking_ref"],
+                name="bkg_ref_uniq",
+                include=["customer_id", "staff_id", "start_time", "status", "created_at"],
+            ),
+        ]
 
     def __str__(self):
         return self.booking_ref
@@ -31,10 +52,13 @@ class BookingEvent(TenantAwareModel):
     booking = models.ForeignKey(Booking, on_delete=models.CASCADE, related_name="events")
     event_type = models.CharField(max_length=50)
     actor = models.JSONField()
-    payload = models.JSONField(default=dict)
+    payload = models.JSONField(default=dict, db_default={})
 
     class Meta:
         db_table = "bookings_event"
+        indexes = [
+            BrinIndex(fields=["created_at"], name="bookingevent_created_brin", pages_per_range=32),
+        ]
 
     def __str__(self):
         return f"{self.booking_id} - {self.event_type}"
@@ -1,6 +1,8 @@
 """Communications admin."""
 from django.contrib import admin
 
+from tenants_core.core.admin_mixins import ChangelistOnlyMixin
+
 from .models import Notification, NotificationTemplate
 
 
@@ -11,6 +13,7 @@ class NotificationTemplateAdmin(admin.ModelAdmin):
 
 
 @admin.register(Notification)
-class NotificationAdmin(admin.ModelAdmin):
+class NotificationAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ["recipient_type", "channel", "status", "sent_at", "created_at"]
     list_filter = ["status", "channel"]
+    changelist_only_fields = ("id", "recipient_type", "channel", "status", "sent_at", "created_at")
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:25
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('communications', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='notification',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['payload'], name='notification_payload_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='notification',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['metadata'], name='notification_meta_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communications', '0003_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='payload',
+            field=models.JSONField(db_default={}, default=dict),
+        ),
+    ]
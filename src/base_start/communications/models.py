@@ -1,4 +1,5 @@
 """Communication models."""
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 from django.db import models
 
 from tenants_core.core.models import TenantAwareModel
@@ -27,13 +28,19 @@ class Notification(TenantAwareModel):
     channel = models.CharField(max_length=50)
     template_id = models.UUIDField(null=True, blank=True)
     status = models.CharField(max_length=50, db_index=True)
-    payload = models.JSONField(default=dict)
+    payload = models.JSONField(default=dict, db_default={})
     metadata = models.JSONField(default=dict, blank=True)
     scheduled_for = models.DateTimeField(null=True, blank=True)
     sent_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "communications_notification"
+        indexes = [
+            # Default opclass so key-existence (?) lookups on payload can use it
+            GinIndex(fields=["payload"], name="notification_payload_gin"),
+            GinIndex(fields=["metadata"], name="notification_meta_gin", opclasses=["jsonb_path_ops"]),
+            BrinIndex(fields=["created_at"], name="notification_created_brin", pages_per_range=32),
+        ]
 
     def __str__(self):
         return f"{self.recipient_type} - {self.channel}"
@@ -1,4 +1,5 @@
 """Customer models."""
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from tenants_core.core.models import TenantAwareModel
@@ -11,11 +12,14 @@ class Customer(TenantAwareModel):
     full_name = models.CharField(max_length=255)
     email = models.EmailField(blank=True)
     locale = models.CharField(max_length=10, default="ar")
-    consent = models.JSONField(default=dict)
+    consent = models.JSONField(default=dict, db_default={})
     metadata = models.JSONField(default=dict, blank=True)
 
     class Meta:
         db_table = "customers_customer"
+        indexes = [
+            GinIndex(fields=["metadata"], name="customer_meta_gin", opclasses=["jsonb_path_ops"]),
+        ]
 
     def __str__(self):
         return self.full_name
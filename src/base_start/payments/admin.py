@@ -1,11 +1,16 @@
 """Payments admin."""
 from django.contrib import admin
 
+from tenants_core.core.admin_mixins import ChangelistOnlyMixin
+
 from .models import Transaction
 
 
 @admin.register(Transaction)
-class TransactionAdmin(admin.ModelAdmin):
+class TransactionAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ["id", "type", "amount", "status", "method", "created_at"]
     list_filter = ["type", "status", "method"]
     search_fields = ["customer_id", "booking_id"]
+    changelist_only_fields = (
+        "id", "type", "amount", "status", "method", "customer_id", "booking_id", "created_at",
+    )
@@ -1,4 +1,5 @@
 """Payment models."""
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 from django.db import models
 
 from tenants_core.core.models import TenantAwareModel
@@ -13,11 +14,17 @@ class Transaction(TenantAwareModel):
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     status = models.CharField(max_length=50, db_index=True)
     method = models.CharField(max_length=50)
-    provider = models.JSONField(default=dict)
+    provider = models.JSONField(default=dict, db_default={})
     metadata = models.JSONField(default=dict, blank=True)
 
     class Meta:
         db_table = "payments_transaction"
+        indexes = [
+            # Default opclass so key-existence (?) lookups on provider can use it
+            GinIndex(fields=["provider"], name="transaction_provider_gin"),
+            GinIndex(fields=["metadata"], name="transaction_meta_gin", opclasses=["jsonb_path_ops"]),
+            BrinIndex(fields=["created_at"], name="transaction_created_brin", pages_per_range=32),
+        ]
 
     def __str__(self):
         return f"{self.type} - {self.amount}"
@@ -1,11 +1,14 @@
 """Resources admin."""
 from django.contrib import admin
 
+from tenants_core.core.admin_mixins import ChangelistOnlyMixin
+
 from .models import Resource
 
 
 @admin.register(Resource)
-class ResourceAdmin(admin.ModelAdmin):
+class ResourceAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ["resource_type", "key", "locale", "created_at"]
     list_filter = ["resource_type", "locale"]
     search_fields = ["key"]
+    changelist_only_fields = ("id", "resource_type", "key", "locale", "created_at")
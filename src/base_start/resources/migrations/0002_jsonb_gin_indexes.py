@@ -0,0 +1,22 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:25
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('resources', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='resource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['metadata'], name='resource_meta_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
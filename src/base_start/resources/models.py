@@ -1,4 +1,5 @@
 """Resource models."""
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from tenants_core.core.models import TenantAwareModel
@@ -15,6 +16,9 @@ class Resource(TenantAwareModel):
 
     class Meta:
         db_table = "resources_resource"
+        indexes = [
+            GinIndex(fields=["metadata"], name="resource_meta_gin", opclasses=["jsonb_path_ops"]),
+        ]
 
     def __str__(self):
         return f"{self.resource_type} - {self.key}"
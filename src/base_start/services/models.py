@@ -1,4 +1,5 @@
 """Service models."""
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from tenants_core.core.models import TenantAwareModel
@@ -16,6 +17,9 @@ class Service(TenantAwareModel):
 
     class Meta:
         db_table = "services_service"
+        indexes = [
+            GinIndex(fields=["metadata"], name="service_meta_gin", opclasses=["jsonb_path_ops"]),
+        ]
         ordering = ["name"]
 
     def __str__(self):
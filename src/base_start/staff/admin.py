@@ -15,3 +15,4 @@ class StaffAdmin(admin.ModelAdmin):
 class AvailabilityAdmin(admin.ModelAdmin):
     list_display = ["staff", "type", "start_time", "end_time"]
     list_filter = ["type"]
+    list_select_related = ["staff"]
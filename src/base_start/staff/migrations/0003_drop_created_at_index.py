@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('staff', '0002_jsonb_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='availability',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='staff',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:33
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('staff', '0003_drop_created_at_index'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='availability',
+            index=models.Index(fields=['staff', 'start_time', 'end_time'], name='avail_staff_window'),
+        ),
+        AddIndexConcurrently(
+            model_name='availability',
+            index=models.Index(fields=['start_time', 'end_time'], name='avail_window_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='staff',
+            index=models.Index(fields=['is_active', 'email'], name='staff_active_email_idx'),
+        ),
+        # Drop the standalone FK index only once the composite covering it exists
+        migrations.AlterField(
+            model_name='availability',
+            name='staff',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='availabilities', to='staff.staff'),
+        ),
+    ]
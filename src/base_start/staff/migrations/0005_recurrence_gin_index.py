@@ -0,0 +1,22 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:34
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('staff', '0004_availability_window_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='availability',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['recurrence'], name='availability_recur_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
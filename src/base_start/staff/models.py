@@ -1,4 +1,5 @@
 """Staff models."""
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from tenants_core.core.models import TenantAwareModel
@@ -15,6 +16,10 @@ class Staff(TenantAwareModel):
 
     class Meta:
         db_table = "staff_staff"
+        indexes = [
+            GinIndex(fields=["metadata"], name="staff_meta_gin", opclasses=["jsonb_path_ops"]),
+            models.Index(fields=["is_active", "email"], name="staff_active_email_idx"),
+        ]
 
     def __str__(self):
         return self.full_name
@@ -23,7 +28,10 @@ class Staff(TenantAwareModel):
 class Availability(TenantAwareModel):
     """Staff availability model."""
 
-    staff = models.ForeignKey(Staff, on_delete=models.CASCADE, related_name="availabilities")
+    # Indexed through avail_staff_window below
+    staff = models.ForeignKey(
+        Staff, on_delete=models.CASCADE, related_name="availabilities", db_index=False
+    )
     type = models.CharField(max_length=50)
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
@@ -32,6 +40,13 @@ class Availability(TenantAwareModel):
 
     class Meta:
         db_table = "staff_availability"
+        indexes = [
+            GinIndex(fields=["metadata"], name="availability_meta_gin", opclasses=["jsonb_path_ops"]),
+            GinIndex(fields=["recurrence"], name="availability_recur_gin", opclasses=["jsonb_path_ops"]),
+            # Availability checks: staff_id = ? AND start_time <= ? AND end_time >= ?
+            models.Index(fields=["staff", "start_time", "end_time"], name="avail_staff_window"),
+            models.Index(fields=["start_time", "end_time"], name="avail_window_idx"),
+        ]
 
     def __str__(self):
         return f"{self.staff} - {self.type}"
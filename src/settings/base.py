@@ -3,6 +3,7 @@ Django settings for BookMe project.
 """
 from datetime import timedelta
 from pathlib import Path
+from types import MappingProxyType
 
 import environ
 
@@ -28,6 +29,10 @@ env_file = ROOT_DIR / ".env"
 if env_file.exists():
     environ.Env.read_env(str(env_file))
 
+# Values read more than once below; resolve each env var a single time
+REDIS_URL = env("REDIS_URL")
+LOG_LEVEL = env("LOG_LEVEL", default="INFO")
+
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = env("SECRET_KEY")
 
@@ -42,16 +47,21 @@ TENANT_BASE_DOMAIN = env(
 # Whether to auto-create a Domain row for the tenant's primary_domain on tenant creation
 TENANT_AUTO_CREATE_PRIMARY_DOMAIN = env("TENANT_AUTO_CREATE_PRIMARY_DOMAIN", default=True)
 
-ALLOWED_HOSTS = env("ALLOWED_HOSTS")
-# Ensure localhost access out of the box
-for default_host in ["localhost", "127.0.0.1"]:
-    if default_host not in ALLOWED_HOSTS:
-        ALLOWED_HOSTS.append(default_host)
+# Whether each web process LISTENs for Domain changes to refresh its allowed-hosts cache
+TENANT_DOMAIN_CHANGE_LISTENER = env.bool("TENANT_DOMAIN_CHANGE_LISTENER", default=True)
+
+# Rows per INSERT when flushing buffered TenantLifecycle events (see tenant.lifecycle)
+TENANT_LIFECYCLE_BATCH_SIZE = env.int("TENANT_LIFECYCLE_BATCH_SIZE", default=1000)
+
+# Seconds a tenant admin membership lookup stays cached (see users.memberships)
+TENANT_MEMBERSHIP_CACHE_TIMEOUT = env.int("TENANT_MEMBERSHIP_CACHE_TIMEOUT", default=60)
 
 # Allow all subdomains of the configured base domain (e.g., *.bookme.ma or *.localhost)
 base_wildcard = f".{TENANT_BASE_DOMAIN}" if not TENANT_BASE_DOMAIN.startswith(".") else TENANT_BASE_DOMAIN
-if base_wildcard not in ALLOWED_HOSTS:
-    ALLOWED_HOSTS.append(base_wildcard)
+
+# Configured hosts first, then localhost access out of the box and the base wildcard;
+# dict.fromkeys drops duplicates while keeping that order
+ALLOWED_HOSTS = list(dict.fromkeys([*env("ALLOWED_HOSTS"), "localhost", "127.0.0.1", base_wildcard]))
 
 # Application definition
 SHARED_APPS = [
@@ -88,9 +98,8 @@ TENANT_APPS = [
     "base_start.resources",
 ]
 
-INSTALLED_APPS = list(SHARED_APPS) + [
-    app for app in TENANT_APPS if app not in SHARED_APPS
-]
+_shared_apps = frozenset(SHARED_APPS)
+INSTALLED_APPS = [*SHARED_APPS, *(app for app in TENANT_APPS if app not in _shared_apps)]
 
 MIDDLEWARE = [
     # Allow hosts dynamically from DB Domains and wildcard base domain before tenant routing
@@ -136,7 +145,10 @@ DATABASES = {
         **env.db("DATABASE_URL"),
         "ENGINE": "django_tenants.postgresql_backend",
         "ATOMIC_REQUESTS": True,
-        "CONN_MAX_AGE": 60,
+        # Set to 0 when a session-mode pgbouncer holds the server connections instead
+        "CONN_MAX_AGE": env.int("DATABASE_CONN_MAX_AGE", default=60),
+        # Drop a persistent connection that died between requests instead of erroring
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
             "connect_timeout": 10,
         },
@@ -155,12 +167,12 @@ TENANT_LIMIT_SET_CALLS = True
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
-        "LOCATION": env("REDIS_URL"),
+        "LOCATION": REDIS_URL,
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "SOCKET_CONNECT_TIMEOUT": 5,
             "SOCKET_TIMEOUT": 5,
-            "COMPRESSOR": "django_redis.compressors.zlib.ZlibCompressor",
+            "COMPRESSOR": "tenants_core.core.cache.ThresholdZlibCompressor",
             "CONNECTION_POOL_KWARGS": {"max_connections": 50},
         },
         "KEY_PREFIX": "bookme",
@@ -296,8 +308,8 @@ PHONENUMBER_DEFAULT_REGION = "MA"
 PHONENUMBER_DB_FORMAT = "E164"
 
 # Celery Configuration
-CELERY_BROKER_URL = env("CELERY_BROKER_URL", default=env("REDIS_URL"))
-CELERY_RESULT_BACKEND = env("REDIS_URL")
+CELERY_BROKER_URL = env("CELERY_BROKER_URL", default=REDIS_URL)
+CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
@@ -317,8 +329,7 @@ LOGGING = {
             "style": "{",
         },
         "json": {
-            "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
-            "format": "%(asctime)s %(name)s %(levelname)s %(message)s",
+            "()": "tenants_core.core.log_handlers.OrjsonFormatter",
         },
     },
     "handlers": {
@@ -327,7 +338,7 @@ LOGGING = {
             "formatter": "verbose",
         },
         "file": {
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "tenants_core.core.log_handlers.QueuedRotatingFileHandler",
             "filename": ROOT_DIR / "logs" / "django.log",
             "maxBytes": 10485760,  # 10MB
             "backupCount": 5,
@@ -336,12 +347,12 @@ LOGGING = {
     },
     "root": {
         "handlers": ["console"],
-        "level": env("LOG_LEVEL", default="INFO"),
+        "level": LOG_LEVEL,
     },
     "loggers": {
         "django": {
             "handlers": ["console", "file"],
-            "level": env("LOG_LEVEL", default="INFO"),
+            "level": LOG_LEVEL,
             "propagate": False,
         },
         "django.request": {
@@ -363,14 +374,17 @@ LOGGING = {
 }
 # config to server http not https
 SECURE_SSL_REDIRECT = False
-# Security
+# Security hardening applied whenever DEBUG is off (shared with production.py)
+_PRODUCTION_SECURITY = MappingProxyType({
+    "SECURE_SSL_REDIRECT": True,
+    "SESSION_COOKIE_SECURE": True,
+    "CSRF_COOKIE_SECURE": True,
+    "SECURE_BROWSER_XSS_FILTER": True,
+    "SECURE_CONTENT_TYPE_NOSNIFF": True,
+    "SECURE_HSTS_SECONDS": 31536000,
+    "SECURE_HSTS_INCLUDE_SUBDOMAINS": True,
+    "SECURE_HSTS_PRELOAD": True,
+    "X_FRAME_OPTIONS": "DENY",
+})
 if not DEBUG:
-    SECURE_SSL_REDIRECT = True
-    SESSION_COOKIE_SECURE = True
-    CSRF_COOKIE_SECURE = True
-    SECURE_BROWSER_XSS_FILTER = True
-    SECURE_CONTENT_TYPE_NOSNIFF = True
-    SECURE_HSTS_SECONDS = 31536000
-    SECURE_HSTS_INCLUDE_SUBDOMAINS = True
-    SECURE_HSTS_PRELOAD = True
-    X_FRAME_OPTIONS = "DENY"
+    globals().update(_PRODUCTION_SECURITY)
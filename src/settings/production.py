@@ -1,30 +1,17 @@
 """
 Production settings.
 """
-import sentry_sdk
-from sentry_sdk.integrations.celery import CeleryIntegration
-from sentry_sdk.integrations.django import DjangoIntegration
-from sentry_sdk.integrations.redis import RedisIntegration
-
 from .base import *  # noqa
-from .base import env
+from .base import _PRODUCTION_SECURITY, env
 
 DEBUG = False
 
 # Security
 ALLOWED_HOSTS = env.list("ALLOWED_HOSTS")
-SECURE_SSL_REDIRECT = True
-SESSION_COOKIE_SECURE = True
-CSRF_COOKIE_SECURE = True
-SECURE_BROWSER_XSS_FILTER = True
-SECURE_CONTENT_TYPE_NOSNIFF = True
-SECURE_HSTS_SECONDS = 31536000
-SECURE_HSTS_INCLUDE_SUBDOMAINS = True
-SECURE_HSTS_PRELOAD = True
-X_FRAME_OPTIONS = "DENY"
+globals().update(_PRODUCTION_SECURITY)
 
 # Database
-DATABASES["default"]["CONN_MAX_AGE"] = 600  # type: ignore
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DATABASE_CONN_MAX_AGE", default=600)  # type: ignore
 DATABASES["default"]["OPTIONS"]["connect_timeout"] = 10  # type: ignore
 
 # Static files with S3
@@ -51,9 +38,16 @@ EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default="noreply@bookme.ma")
 
 # Sentry
-if env("SENTRY_DSN", default=None):
+SENTRY_DSN = env("SENTRY_DSN", default=None)
+if SENTRY_DSN:
+    # Imported here so deployments without Sentry never load the SDK
+    import sentry_sdk
+    from sentry_sdk.integrations.celery import CeleryIntegration
+    from sentry_sdk.integrations.django import DjangoIntegration
+    from sentry_sdk.integrations.redis import RedisIntegration
+
     sentry_sdk.init(
-        dsn=env("SENTRY_DSN"),
+        dsn=SENTRY_DSN,
         integrations=[
             DjangoIntegration(),
             CeleryIntegration(),
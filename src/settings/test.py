@@ -33,6 +33,9 @@ CACHES = {
     }
 }
 
+# No background LISTEN thread for Domain changes in tests
+TENANT_DOMAIN_CHANGE_LISTENER = False
+
 # Celery - run tasks synchronously in tests
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
@@ -58,8 +61,11 @@ LOGGING = {  # type: ignore
     },
 }
 
-# Disable migrations for faster tests
+# Disable migrations for faster tests (what pytest's --nomigrations does, also for manage.py test).
+# A mapping that claims every app label; a defaultdict would not, as `in` ignores its factory.
 class DisableMigrations:
+    __slots__ = ()
+
     def __contains__(self, item):
         return True
 
@@ -67,4 +73,4 @@ class DisableMigrations:
         return None
 
 
-# MIGRATION_MODULES = DisableMigrations()
+MIGRATION_MODULES = DisableMigrations()
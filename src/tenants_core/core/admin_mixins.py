@@ -0,0 +1,21 @@
+"""Reusable ModelAdmin mixins."""
+
+
+class ChangelistOnlyMixin:
+    """
+    Load only the listed columns on the changelist.
+
+    Large JSON columns are never rendered in list_display, so fetching them for
+    every row of a changelist page is wasted I/O. The change form still loads
+    the full row.
+    """
+
+    changelist_only_fields: tuple[str, ...] = ()
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        match = getattr(request, "resolver_match", None)
+        url_name = getattr(match, "url_name", None) or ""
+        if self.changelist_only_fields and url_name.endswith("_changelist"):
+            qs = qs.only(*self.changelist_only_fields)
+        return qs
@@ -0,0 +1,18 @@
+"""
+Cache backend helpers.
+"""
+from django_redis.compressors.zlib import ZlibCompressor
+
+
+class ThresholdZlibCompressor(ZlibCompressor):
+    """
+    Zlib compressor that leaves values under 1 KiB uncompressed.
+
+    Sessions and most cached entries are a few hundred bytes, where zlib saves
+    little space but still costs CPU on every read and write. Values stored
+    uncompressed remain readable: django-redis falls back to the raw bytes
+    when decompression fails.
+    """
+
+    min_length = 1024
+    preset = 1
@@ -0,0 +1,34 @@
+"""
+Custom model fields.
+"""
+import orjson
+from django.db import models
+from django.db.backends.postgresql.psycopg_any import Jsonb
+
+# Same output as json.dumps for the types it accepts (int keys become strings);
+# UUIDs and datetimes are encoded natively instead of raising TypeError
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_dumps(value) -> str:
+    return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+
+
+class OrjsonJSONField(models.JSONField):
+    """
+    JSONField that encodes values with orjson on PostgreSQL.
+
+    Reads are unchanged: psycopg decodes jsonb itself. A custom ``encoder`` or
+    another database vendor falls back to the stock json.dumps path.
+    """
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if (
+            self.encoder is None
+            and connection.vendor == "postgresql"
+            and not hasattr(value, "as_sql")
+        ):
+            return Jsonb(value, dumps=_orjson_dumps)
+        return super().get_db_prep_value(value, connection, prepared=True)
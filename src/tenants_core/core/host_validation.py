@@ -3,41 +3,168 @@ Utilities for host validation against known tenant domains.
 """
 from __future__ import annotations
 
+import logging
+import threading
 from time import time
 
 from django.conf import settings
+from django.dispatch import receiver
+from django.test.signals import setting_changed
 
 try:
     from tenants_core.tenant.models import Domain
 except Exception:  # During early migrations, the model may not be ready
     Domain = None  # type: ignore
 
+logger = logging.getLogger(__name__)
 
-_CACHE_TTL = 30  # seconds
-_cache = {"ts": 0.0, "hosts": set()}
+# Domain changes are pushed via LISTEN/NOTIFY; the long TTL is only a safety net
+# while a listener is connected, otherwise the cache expires as often as before
+_CACHE_TTL = 300  # seconds
+_FALLBACK_CACHE_TTL = 30  # seconds
+_cache = {"ts": 0.0, "merged": frozenset(), "suffixes": ()}
+_cache_lock = threading.Lock()
 
+DOMAIN_CHANGED_CHANNEL = "domain_changed"
+_listener_started = False
+_listener_alive = False
 
-def _load_hosts_from_db() -> set[str]:
+
+def _load_hosts_from_db() -> frozenset[str]:
     if Domain is None:
-        return set()
+        return frozenset()
     try:
-        return set(Domain.objects.values_list("domain", flat=True))
+        return frozenset(
+            Domain.objects.values_list("domain", flat=True).iterator(chunk_size=5000)
+        )
     except Exception:
         # DB not ready or table missing during migrate
-        return set()
+        return frozenset()
+
+
+def invalidate_allowed_hosts_cache() -> None:
+    """Force the next get_allowed_hosts_dynamic() call to reload from the DB."""
+    _cache["ts"] = 0.0
+
+
+def _listen_for_domain_changes() -> None:
+    """Expire the host cache whenever a Domain change is NOTIFYed (psycopg 3 only)."""
+    from django.db import connections
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    global _listener_started, _listener_alive
+
+    if not is_psycopg3:
+        return
+
+    wrapper = connections.create_connection("default")
+    try:
+        with wrapper.get_new_connection(wrapper.get_connection_params()) as conn:
+            conn.autocommit = True
+            conn.execute(f"LISTEN {DOMAIN_CHANGED_CHANNEL}")
+            _listener_alive = True
+            for _notify in conn.notifies():
+                invalidate_allowed_hosts_cache()
+    except Exception as e:
+        logger.warning("Domain change listener stopped, falling back to TTL refresh: %s", e)
+    finally:
+        # Changes may have been missed: reload now, keep the short TTL and let
+        # the next refresh start a new listener
+        _listener_alive = False
+        _listener_started = False
+        invalidate_allowed_hosts_cache()
+
+
+def _start_domain_listener() -> None:
+    """Start the per-process LISTEN thread once (called with ``_cache_lock`` held)."""
+    global _listener_started
+    _listener_started = True
+    if not getattr(settings, "TENANT_DOMAIN_CHANGE_LISTENER", True):
+        return
+    threading.Thread(
+        target=_listen_for_domain_changes, name="domain-change-listener", daemon=True
+    ).start()
+
+
+def _split_allowed_hosts(hosts) -> tuple[set[str], tuple[str, ...]]:
+    """Split ALLOWED_HOSTS-style patterns into exact names and ``.suffix`` wildcards.
+
+    ``.example.com`` matches ``example.com`` itself and any subdomain, as in Django;
+    ``*`` becomes the empty suffix, which every host ends with.
+    """
+    exact: set[str] = set()
+    suffixes: list[str] = []
+    for pattern in hosts:
+        pattern = pattern.lower()
+        if pattern == "*":
+            suffixes.append("")
+        elif pattern.startswith("."):
+            exact.add(pattern[1:])
+            suffixes.append(pattern)
+        else:
+            exact.add(pattern)
+    return exact, tuple(suffixes)
 
 
-def get_allowed_hosts_dynamic() -> set[str]:
-    """Return dynamic hostnames allowed based on Domain table, cached briefly."""
+def _refresh_if_stale() -> None:
     now = time()
-    if now - _cache["ts"] > _CACHE_TTL:
-        _cache["hosts"] = _load_hosts_from_db()
-        _cache["ts"] = now
-    return set(_cache["hosts"]) | set(settings.ALLOWED_HOSTS)
+    ttl = _CACHE_TTL if _listener_alive else _FALLBACK_CACHE_TTL
+    if now - _cache["ts"] > ttl:
+        with _cache_lock:
+            if not _listener_started:
+                _start_domain_listener()
+            # Another thread may have refreshed while we waited for the lock
+            if now - _cache["ts"] > ttl:
+                # Stamp first so an invalidation arriving mid-load is not overwritten
+                _cache["ts"] = now
+                exact, suffixes = _split_allowed_hosts(settings.ALLOWED_HOSTS)
+                _cache["merged"] = _load_hosts_from_db().union(exact)
+                _cache["suffixes"] = suffixes
+
+
+def get_allowed_hosts_dynamic() -> frozenset[str]:
+    """Return exact hostnames allowed by the Domain table and ALLOWED_HOSTS, cached briefly.
+
+    Wildcard ``.suffix`` entries of ALLOWED_HOSTS are not in this set; use
+    ``host_is_allowed`` to take them into account.
+    """
+    _refresh_if_stale()
+    return _cache["merged"]
+
+
+def host_is_allowed(host: str) -> bool:
+    """Check a lower-cased host against the cached exact names and wildcard suffixes.
+
+    One set lookup plus a single ``str.endswith`` over the suffix tuple.
+    """
+    _refresh_if_stale()
+    return host in _cache["merged"] or host.endswith(_cache["suffixes"])
+
+
+# Base domain as a one-element exact set and suffix tuple (both empty when unset)
+_BASE_HOSTS: frozenset[str] = frozenset()
+_BASE_SUFFIXES: tuple[str, ...] = ()
+
+
+def reload_base_domain() -> None:
+    """Recompute the cached base domain lookup tables from settings."""
+    global _BASE_HOSTS, _BASE_SUFFIXES
+    base = (getattr(settings, "TENANT_BASE_DOMAIN", None) or "").lstrip(".").lower()
+    _BASE_HOSTS = frozenset({base}) if base else frozenset()
+    _BASE_SUFFIXES = (f".{base}",) if base else ()
+
+
+@receiver(setting_changed)
+def _on_setting_changed(sender, setting, **kwargs):
+    # Keep the caches in sync with override_settings() in tests
+    if setting == "TENANT_BASE_DOMAIN":
+        reload_base_domain()
+    elif setting == "ALLOWED_HOSTS":
+        invalidate_allowed_hosts_cache()
+
+
+reload_base_domain()
 
 
 def host_matches_base_wildcard(host: str) -> bool:
-    base = getattr(settings, "TENANT_BASE_DOMAIN", None)
-    if not base:
-        return False
-    return host == base or host.endswith("." + base)
+    return host in _BASE_HOSTS or host.endswith(_BASE_SUFFIXES)
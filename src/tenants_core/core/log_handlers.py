@@ -0,0 +1,114 @@
+"""
+Logging handlers and formatters.
+"""
+import atexit
+import copy
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+import orjson
+
+# Attributes every LogRecord has; anything else on a record came from ``extra=``
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class OrjsonFormatter(logging.Formatter):
+    """
+    JSON formatter emitting asctime, name, levelname, message and any ``extra`` fields.
+
+    Same keys as the python-json-logger setup it replaces, encoded with orjson.
+    Values orjson cannot encode natively fall back to ``str()``.
+    """
+
+    def format(self, record):
+        payload = {
+            "asctime": self.formatTime(record, self.datefmt),
+            "name": record.name,
+            "levelname": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
+class QueuedRotatingFileHandler(QueueHandler):
+    """
+    RotatingFileHandler that formats and writes on a background thread.
+
+    Logging calls only enqueue the record; a QueueListener owns the file. The
+    listener is started lazily in each process, so workers forked after logging
+    was configured (e.g. gunicorn --preload) get their own thread.
+    """
+
+    def __init__(self, filename, mode="a", maxBytes=0, backupCount=0, encoding=None, delay=False):
+        # Set before anything can fail: logging may close() a half-built handler
+        self._listener = None
+        self._listener_pid = None
+        self._start_lock = threading.Lock()
+        self.target = None
+        super().__init__(queue.SimpleQueue())
+        self.target = RotatingFileHandler(
+            filename,
+            mode=mode,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=delay,
+        )
+
+    def setFormatter(self, fmt):
+        # Formatting happens on the listener thread, not in the caller's
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        """
+        Enqueue a copy of the record with exc_info intact and nothing formatted.
+
+        The stock prepare() formats on the caller's thread and folds the
+        traceback into msg; here only the %-args are merged (so later mutation
+        of an argument cannot change the message) and the target's formatter
+        does the rest on the listener thread.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def emit(self, record):
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+    def _start_listener(self):
+        with self._start_lock:
+            if self._listener_pid == os.getpid():
+                return
+            # A queue inherited across fork has no consumer in this process
+            self.queue = queue.SimpleQueue()
+            self._listener = QueueListener(self.queue, self.target)
+            self._listener.start()
+            self._listener_pid = os.getpid()
+            atexit.register(self._stop_listener)
+
+    def _stop_listener(self):
+        if self._listener is not None and self._listener_pid == os.getpid():
+            self._listener.stop()
+        self._listener = None
+        self._listener_pid = None
+
+    def close(self):
+        self._stop_listener()
+        if self.target is not None:
+            self.target.close()
+        super().close()
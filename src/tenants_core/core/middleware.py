@@ -3,16 +3,27 @@ Middleware for host validation, tenant context, and logging.
 """
 import logging
 import time
-import uuid
+from secrets import token_hex
 
 from django.core.exceptions import DisallowedHost
+from django.http import HttpResponseForbidden
 from django.utils.deprecation import MiddlewareMixin
 from django_tenants.utils import schema_context  # noqa: F401  # may be used in future
 
-from .host_validation import get_allowed_hosts_dynamic, host_matches_base_wildcard
+from .host_validation import host_is_allowed, host_matches_base_wildcard
+
+try:
+    from tenants_core.users.memberships import get_active_membership
+except ImportError:  # users app not installed
+    get_active_membership = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+ADMIN_PREFIX = "/admin"
+
+# Admin endpoints that never need a membership check (login page, JS catalog)
+ADMIN_EXEMPT_PREFIXES = ("/admin/login", "/admin/jsi18n")
+
 
 class DynamicAllowedHostsMiddleware(MiddlewareMixin):
     """Allow hosts that exist in DB Domains or match base wildcard.
@@ -28,9 +39,8 @@ class DynamicAllowedHostsMiddleware(MiddlewareMixin):
         if host in {"localhost", "127.0.0.1"}:
             return None
 
-        # Allow if in configured hosts or in DB domains
-        dynamic_hosts = get_allowed_hosts_dynamic()
-        if host in dynamic_hosts or host_matches_base_wildcard(host):
+        # Allow if in DB domains or matching configured hosts (exact or .suffix)
+        if host_is_allowed(host) or host_matches_base_wildcard(host):
             return None
 
         raise DisallowedHost(host)
@@ -53,6 +63,22 @@ class TenantContextMiddleware(MiddlewareMixin):
             request.current_tenant = None
 
 
+class LazyRequestId:
+    """Request id generated the first time it is rendered with str()."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self):
+        self._value = None
+
+    def __str__(self):
+        if self._value is None:
+            self._value = token_hex(16)
+        return self._value
+
+    __repr__ = __str__
+
+
 class StructuredLoggingMiddleware(MiddlewareMixin):
     """
     Middleware to add structured logging context to all requests.
@@ -60,27 +86,29 @@ class StructuredLoggingMiddleware(MiddlewareMixin):
 
     def process_request(self, request):
         """Add request context."""
-        request.request_id = str(uuid.uuid4())
-        request.start_time = time.time()
+        # No random bytes are read unless something logs or renders the id
+        request.request_id = LazyRequestId()
+        request.start_time = time.monotonic_ns()
 
     def process_response(self, request, response):
         """Log request completion."""
-        if hasattr(request, "start_time"):
-            duration = time.time() - request.start_time
-            tenant_name = getattr(request.current_tenant, "name", "N/A") if hasattr(
-                request, "current_tenant"
-            ) else "N/A"
+        # Skip building the record when INFO is filtered out
+        if hasattr(request, "start_time") and logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.monotonic_ns() - request.start_time) / 1e6
+            tenant = getattr(request, "current_tenant", None)
+            user = getattr(request, "user", None)
 
             logger.info(
                 "Request completed",
                 extra={
-                    "request_id": getattr(request, "request_id", "N/A"),
-                    "tenant": tenant_name,
+                    "request_id": str(getattr(request, "request_id", "N/A")),
+                    "tenant": tenant.name if tenant is not None else "N/A",
                     "method": request.method,
                     "path": request.path,
                     "status_code": response.status_code,
-                    "duration_ms": round(duration * 1000, 2),
-                    "user": str(request.user) if hasattr(request, "user") else "Anonymous",
+                    "duration_ms": round(duration_ms, 2),
+                    # The pk is already loaded; str(user) would go through User.__str__
+                    "user": user.pk if user is not None and user.is_authenticated else "Anonymous",
                 },
             )
 
@@ -93,40 +121,41 @@ class TenantAdminAccessMiddleware(MiddlewareMixin):
 
     This middleware:
     1. Blocks non-members from accessing /admin/
-    2. Adds request.user_role property with the user's TenantRole
-    3. Adds request.user_membership property with the TenantMembership
+    2. Adds request.user_role with the user's TenantRole (admin requests only)
+    3. Adds request.user_membership with the TenantMembership (admin requests only)
     4. Checks RBAC permissions via TenantRole system
     """
 
     def process_request(self, request):
-        path = request.path or ""
-        user = getattr(request, "user", None)
-        tenant = getattr(request, "current_tenant", None)
+        # Non-admin traffic leaves on the first check, before touching anything else
+        path = request.path
+        if not path.startswith(ADMIN_PREFIX):
+            return None
 
-        # Initialize user_role and user_membership attributes
         request.user_role = None
         request.user_membership = None
 
-        # Only process admin paths
-        if not path.startswith("/admin"):
+        # CORS preflights carry no session to check
+        if path.startswith(ADMIN_EXEMPT_PREFIXES) or request.method == "OPTIONS":
             return None
 
         # Allow anonymous to reach login page
-        if not user or not user.is_authenticated:
+        user = request.user
+        if not user.is_authenticated:
             return None
 
         # Superusers can always access
-        if getattr(user, "is_superuser", False):
+        if user.is_superuser:
             return None
 
-        # On public schema, only allow superusers and platform staff
-        schema_name = getattr(tenant, "schema_name", None)
-        if schema_name in (None, "public"):
+        # On public schema, only allow superusers and platform staff.
+        # request.tenant is set by TenantMainMiddleware, which runs before us.
+        tenant = getattr(request, "tenant", None)
+        if tenant is None or tenant.schema_name == "public":
             # Check if user has platform admin access
-            if user.is_superuser or getattr(user, 'is_platform_staff', False):
+            if user.is_platform_staff:
                 return None
             # Block regular users from accessing platform admin
-            from django.http import HttpResponseForbidden
             return HttpResponseForbidden(
                 "You do not have platform admin access. "
                 "This admin interface is for platform administrators only. "
@@ -134,36 +163,26 @@ class TenantAdminAccessMiddleware(MiddlewareMixin):
             )
 
         # Check membership and get role
-        try:
-            from tenants_core.users.models import TenantMembership
-        except Exception:
+        if get_active_membership is None:
             return None
 
-        try:
-            membership = TenantMembership.objects.select_related('tenant_role').get(
-                user=user,
-                tenant_id=getattr(tenant, "id", None),
-                is_active=True
+        # Cached per request on the user and across requests in the Django cache
+        membership = get_active_membership(user, tenant.id)
+        if membership is None:
+            return HttpResponseForbidden(
+                "You are not a member of this tenant. Ask an owner/admin to add you."
             )
 
-            # Add membership and role to request for easy access in views
-            request.user_membership = membership
-            request.user_role = membership.tenant_role
-
-            # Optionally log the user's role for debugging
-            if membership.tenant_role:
-                logger.debug(
-                    f"User {user.email} accessing admin with role: {membership.tenant_role.name}"
-                )
+        # Add membership and role to request for easy access in views
+        request.user_membership = membership
+        request.user_role = membership.tenant_role
 
-            # Access granted - user is a member with a role
-            return None
-
-        except TenantMembership.DoesNotExist:
-            from django.http import HttpResponseForbidden
-
-            return HttpResponseForbidden(
-                "You are not a member of this tenant. Ask an owner/admin to add you."
+        # Optionally log the user's role for debugging
+        # %-style arguments: nothing is formatted unless DEBUG is enabled
+        if membership.tenant_role:
+            logger.debug(
+                "User %s accessing admin with role: %s", user.email, membership.tenant_role.name
             )
 
+        # Access granted - user is a member with a role
         return None
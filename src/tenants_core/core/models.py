@@ -4,6 +4,8 @@ Base model classes for tenant-aware applications.
 import uuid
 
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 
 
 class TenantAwareModel(models.Model):
@@ -13,12 +15,14 @@ class TenantAwareModel(models.Model):
     """
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Not indexed here: append-only subclasses add a BRIN index, others add what they need
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         abstract = True
-        ordering = ["-created_at"]
+        # No default ordering: it would add ORDER BY created_at to every
+        # unordered query. Order explicitly where presentation needs it.
 
     def __repr__(self):
         return f"<{self.__class__.__name__} id={self.id}>"
@@ -36,6 +40,26 @@ class TimestampedModel(models.Model):
         abstract = True
 
 
+class SoftDeleteQuerySet(models.QuerySet):
+    """
+    QuerySet with bulk soft delete/restore, issued as a single UPDATE.
+    """
+
+    def soft_delete(self):
+        """Soft delete every object in the queryset."""
+        return self.update(is_deleted=True, deleted_at=timezone.now())
+
+    def restore(self):
+        """Restore every soft-deleted object in the queryset."""
+        return self.update(is_deleted=False, deleted_at=None)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """
+    Manager exposing SoftDeleteQuerySet methods.
+    """
+
+
 class SoftDeleteModel(models.Model):
     """
     Abstract base model that provides soft delete functionality.
@@ -44,13 +68,17 @@ class SoftDeleteModel(models.Model):
     is_deleted = models.BooleanField(default=False, db_index=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    objects = SoftDeleteManager()
+
     class Meta:
         abstract = True
+        indexes = [
+            # Live-row lookups skip tombstones
+            models.Index(fields=["id"], condition=Q(is_deleted=False), name="%(class)s_alive_idx"),
+        ]
 
     def soft_delete(self):
         """Soft delete the object."""
-        from django.utils import timezone
-
         self.is_deleted = True
         self.deleted_at = timezone.now()
         self.save(update_fields=["is_deleted", "deleted_at"])
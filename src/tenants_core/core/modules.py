@@ -6,10 +6,10 @@ It provides a centralized way to manage which features are available for differe
 business types.
 """
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Module:
     """
     Represents a feature module that can be enabled for a tenant.
@@ -90,6 +90,14 @@ AVAILABLE_MODULES: Dict[str, Module] = {
     ),
 }
 
+# The registry is fixed at import, so the required/optional split is computed once
+_REQUIRED_MODULES = tuple(name for name, module in AVAILABLE_MODULES.items() if module.required)
+_OPTIONAL_MODULES = tuple(name for name, module in AVAILABLE_MODULES.items() if not module.required)
+# Deduplicated in registry order
+_ALL_MODULE_APPS = tuple(
+    dict.fromkeys(app for module in AVAILABLE_MODULES.values() for app in module.apps)
+)
+
 
 def get_module(name: str) -> Module:
     """
@@ -107,6 +115,19 @@ def get_module(name: str) -> Module:
     return AVAILABLE_MODULES[name]
 
 
+def get_module_or_none(name: str) -> Optional[Module]:
+    """
+    Get module by name without raising.
+
+    Args:
+        name: Module identifier
+
+    Returns:
+        Module instance, or None if the module doesn't exist
+    """
+    return AVAILABLE_MODULES.get(name)
+
+
 def get_required_modules() -> List[str]:
     """
     Get list of required module names.
@@ -114,10 +135,7 @@ def get_required_modules() -> List[str]:
     Returns:
         List of module names that are required
     """
-    return [
-        name for name, module in AVAILABLE_MODULES.items()
-        if module.required
-    ]
+    return list(_REQUIRED_MODULES)
 
 
 def get_optional_modules() -> List[str]:
@@ -127,10 +145,7 @@ def get_optional_modules() -> List[str]:
     Returns:
         List of module names that are optional
     """
-    return [
-        name for name, module in AVAILABLE_MODULES.items()
-        if not module.required
-    ]
+    return list(_OPTIONAL_MODULES)
 
 
 def validate_modules(modules: Dict[str, bool]) -> tuple[bool, List[str]]:
@@ -143,19 +158,22 @@ def validate_modules(modules: Dict[str, bool]) -> tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    errors = []
+    enabled = {name for name, is_enabled in modules.items() if is_enabled}
 
-    # Check all required modules are enabled
-    for required_module in get_required_modules():
-        if not modules.get(required_module, False):
-            errors.append(f"Required module '{required_module}' must be enabled")
+    # Required modules that are not enabled (reported in registry order)
+    errors = [
+        f"Required module '{name}' must be enabled"
+        for name in _REQUIRED_MODULES
+        if name not in enabled
+    ]
 
-    # Check for unknown modules
-    for module_name in modules.keys():
-        if module_name not in AVAILABLE_MODULES:
-            errors.append(f"Unknown module: '{module_name}'")
+    # Unknown modules (sorted so the message order is stable)
+    errors.extend(
+        f"Unknown module: '{name}'"
+        for name in sorted(modules.keys() - AVAILABLE_MODULES.keys())
+    )
 
-    return (len(errors) == 0, errors)
+    return (not errors, errors)
 
 
 def get_all_module_apps() -> List[str]:
@@ -165,7 +183,4 @@ def get_all_module_apps() -> List[str]:
     Returns:
         List of Django app paths
     """
-    apps = []
-    for module in AVAILABLE_MODULES.values():
-        apps.extend(module.apps)
-    return list(set(apps))  # Remove duplicates
+    return list(_ALL_MODULE_APPS)
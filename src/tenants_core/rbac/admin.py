@@ -1,20 +1,42 @@
 """Admin interface for tenant-scoped RBAC."""
+from functools import lru_cache
 
 from django import forms
 from django.contrib import admin
 from django.contrib.auth.models import Permission
 from django.db import connection
+from django.db.models import Func, IntegerField
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 
 from .models import TenantRole
 
+# Static changelist badges, marked safe once instead of per row
+NO_PERMISSIONS_BADGE = mark_safe('<span style="color: #999;">0 permissions</span>')
+SYSTEM_BADGE = mark_safe(
+    '<span style="background: #417690; color: white; padding: 3px 8px; '
+    'border-radius: 3px; font-size: 11px; font-weight: bold;">SYSTEM</span>'
+)
+CUSTOM_BADGE = mark_safe('<span style="color: #666; font-size: 11px;">Custom</span>')
+ACTIVE_BADGE = mark_safe('<span style="color: #28a745;">●</span> Active')
+INACTIVE_BADGE = mark_safe('<span style="color: #dc3545;">●</span> Inactive')
+
+
+class JSONArrayLength(Func):
+    """Length of a JSONB array, 0 for any other JSON value (PostgreSQL)."""
+    template = (
+        "CASE WHEN jsonb_typeof(%(expressions)s) = 'array' "
+        "THEN jsonb_array_length(%(expressions)s) ELSE 0 END"
+    )
+    output_field = IntegerField()
+
 
 class TenantRoleAdminForm(forms.ModelForm):
     """
     Custom form for TenantRole admin with permission selection widget.
     """
-    # Allowed app labels for tenant role permissions
-    ALLOWED_APP_LABELS = [
+    # Allowed app labels for tenant role permissions (frozen: only used for membership)
+    ALLOWED_APP_LABELS = frozenset([
         'services',     # Services
         'staff',        # Staff management
         'customers',    # Customer management
@@ -22,17 +44,32 @@ class TenantRoleAdminForm(forms.ModelForm):
         'communications', # Notifications
         'payments',     # Payments
         'resources',    # Resources
-    ]
+    ])
 
     # Excluded permissions (even from allowed apps)
-    EXCLUDED_PERMISSIONS = [
+    EXCLUDED_PERMISSIONS = frozenset([
         # User-related (managed via Team Members admin)
         'add_user', 'change_user', 'delete_user',
         # Membership management (prevents role escalation)
         'add_tenantmembership', 'change_tenantmembership', 'delete_tenantmembership',
         # Role management (only Owner should manage roles)
         'add_tenantrole', 'change_tenantrole', 'delete_tenantrole',
-    ]
+    ])
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def permissions_queryset(cls):
+        """
+        Assignable permissions, built once per form class.
+
+        Never evaluated here: ModelMultipleChoiceField clones it with .all(),
+        so each form still reads current rows and no result cache is shared.
+        """
+        return Permission.objects.filter(
+            content_type__app_label__in=cls.ALLOWED_APP_LABELS
+        ).exclude(
+            codename__in=cls.EXCLUDED_PERMISSIONS
+        ).select_related('content_type').order_by('content_type__app_label', 'codename')
 
     class Meta:
         model = TenantRole
@@ -45,11 +82,7 @@ class TenantRoleAdminForm(forms.ModelForm):
 
         # Add permissions field as a custom field
         self.fields['permissions'] = forms.ModelMultipleChoiceField(
-            queryset=Permission.objects.filter(
-                content_type__app_label__in=self.ALLOWED_APP_LABELS
-            ).exclude(
-                codename__in=self.EXCLUDED_PERMISSIONS
-            ).select_related('content_type').order_by('content_type__app_label', 'codename'),
+            queryset=self.permissions_queryset(),
             required=False,
             widget=admin.widgets.FilteredSelectMultiple(
                 verbose_name='Permissions',
@@ -58,11 +91,16 @@ class TenantRoleAdminForm(forms.ModelForm):
             help_text='Select the permissions this role should grant to users.'
         )
 
-        # If editing existing role, pre-select permissions from JSONField
+        # If editing existing role, pre-select permissions from JSONField.
+        # TenantRole.permissions holds codenames, which are only unique within an
+        # app, so resolve them among the assignable (ALLOWED_APP_LABELS) permissions
+        # and pass pks: one query, and nothing for the field to re-resolve.
         if self.instance.pk and self.instance.permissions:
             permission_codenames = self.instance.permissions
-            self.initial['permissions'] = Permission.objects.filter(
-                codename__in=permission_codenames
+            self.initial['permissions'] = list(
+                self.permissions_queryset().filter(
+                    codename__in=permission_codenames
+                ).values_list('pk', flat=True)
             )
 
         # Auto-populate tenant_id from current tenant
@@ -100,23 +138,12 @@ class TenantRoleAdminForm(forms.ModelForm):
         # Use the stored permissions from clean()
         if hasattr(self, '_selected_permissions'):
             selected_permissions = self._selected_permissions
-            if selected_permissions:
-                instance.permissions = [
-                    perm.codename for perm in selected_permissions
-                ]
-            else:
-                instance.permissions = []
-        elif 'permissions' in self.cleaned_data:
-            selected_permissions = self.cleaned_data['permissions']
-            if selected_permissions:
-                instance.permissions = [
-                    perm.codename for perm in selected_permissions
-                ]
-            else:
-                instance.permissions = []
         else:
-            # If no permissions were selected, set empty list
-            instance.permissions = []
+            selected_permissions = self.cleaned_data.get('permissions') or []
+
+        # Unique and sorted: same-named permissions from several apps collapse
+        # into one codename, and equal selections always store the same JSON
+        instance.permissions = sorted({perm.codename for perm in selected_permissions})
 
         if commit:
             instance.save()
@@ -176,9 +203,17 @@ class TenantRoleAdmin(admin.ModelAdmin):
         """
         qs = super().get_queryset(request)
         tenant = getattr(connection, 'tenant', None)
-        if tenant:
-            return qs.filter(tenant_id=tenant.id)
-        return qs.none()
+        if not tenant:
+            return qs.none()
+
+        qs = qs.filter(tenant_id=tenant.id).annotate(
+            permission_total=JSONArrayLength('permissions')
+        )
+        # The changelist only shows the count: leave the JSON columns in the database
+        match = request.resolver_match
+        if match and match.url_name and match.url_name.endswith('_changelist'):
+            qs = qs.defer('permissions', 'metadata')
+        return qs
 
     def tenant_id_display(self, obj):
         """Display tenant_id in read-only format."""
@@ -192,37 +227,25 @@ class TenantRoleAdmin(admin.ModelAdmin):
 
     def permission_count(self, obj):
         """Display count of permissions assigned to this role."""
-        count = len(obj.permissions or [])
+        count = obj.permission_total
         if count == 0:
-            return format_html('<span style="color: #999;">0 permissions</span>')
+            return NO_PERMISSIONS_BADGE
         return format_html(
             '<strong>{}</strong> permission{}',
             count,
             's' if count != 1 else ''
         )
     permission_count.short_description = 'Permissions'
+    permission_count.admin_order_field = 'permission_total'
 
     def is_system_badge(self, obj):
         """Display badge for system roles."""
-        if obj.is_system:
-            return format_html(
-                '<span style="background: #417690; color: white; padding: 3px 8px; '
-                'border-radius: 3px; font-size: 11px; font-weight: bold;">SYSTEM</span>'
-            )
-        return format_html(
-            '<span style="color: #666; font-size: 11px;">Custom</span>'
-        )
+        return SYSTEM_BADGE if obj.is_system else CUSTOM_BADGE
     is_system_badge.short_description = 'Type'
 
     def is_active_badge(self, obj):
         """Display badge for active status."""
-        if obj.is_active:
-            return format_html(
-                '<span style="color: #28a745;">●</span> Active'
-            )
-        return format_html(
-            '<span style="color: #dc3545;">●</span> Inactive'
-        )
+        return ACTIVE_BADGE if obj.is_active else INACTIVE_BADGE
     is_active_badge.short_description = 'Status'
 
     def has_module_permission(self, request):
@@ -233,13 +256,9 @@ class TenantRoleAdmin(admin.ModelAdmin):
         if request.user.is_superuser:
             return True
 
-        # Check if user has any RBAC-related permission
-        return (
-            request.user.has_perm('rbac.view_tenantrole') or
-            request.user.has_perm('rbac.add_tenantrole') or
-            request.user.has_perm('rbac.change_tenantrole') or
-            request.user.has_perm('rbac.delete_tenantrole')
-        )
+        # Any RBAC permission grants the module; TenantRole is the app's only
+        # model, so this is the same as checking its four permissions
+        return request.user.has_module_perms('rbac')
 
     def has_view_permission(self, request, obj=None):
         """
@@ -1,12 +1,60 @@
 """Tenant-scoped RBAC permission backend."""
+import logging
+from functools import lru_cache
 
 from django.contrib.auth.backends import BaseBackend
 from django.contrib.auth.models import Permission
 from django.db import connection
+from django.db.models import Q
 
 from tenants_core.rbac.models import TenantRole
+from tenants_core.users.memberships import NOT_CACHED, get_active_membership, get_cached_membership
 from tenants_core.users.models import User
 
+logger = logging.getLogger(__name__)
+
+# Permission sets are frozensets: read-only, so one instance can be shared safely
+_NO_PERMISSIONS: frozenset[str] = frozenset()
+
+
+@lru_cache(maxsize=1)
+def codename_app_labels() -> dict[str, tuple[str, ...]]:
+    """
+    Map each permission codename to the app labels defining it.
+
+    Permissions only change on migrate, so the table is read once per process;
+    rbac.signals clears this cache on post_migrate. The public tables are named
+    explicitly, so a cold cache costs one SELECT and no search_path switch
+    (auth is also a tenant app, so the tenant schema has its own copy).
+    """
+    from django.contrib.contenttypes.models import ContentType
+    from django_tenants.utils import get_public_schema_name
+
+    qn = connection.ops.quote_name
+    public = qn(get_public_schema_name())
+    sql = (
+        f"SELECT p.codename, ct.app_label "
+        f"FROM {public}.{qn(Permission._meta.db_table)} p "
+        f"JOIN {public}.{qn(ContentType._meta.db_table)} ct ON ct.id = p.content_type_id"
+    )
+
+    labels: dict[str, tuple[str, ...]] = {}
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        for codename, app_label in cursor.fetchall():
+            labels[codename] = labels.get(codename, ()) + (app_label,)
+    return labels
+
+
+@lru_cache(maxsize=1)
+def all_permissions() -> frozenset[str]:
+    """Every "app_label.codename" permission, granted as a whole to superusers."""
+    return frozenset(
+        f"{app_label}.{codename}"
+        for codename, app_labels in codename_app_labels().items()
+        for app_label in app_labels
+    )
+
 
 class TenantRolePermissionBackend(BaseBackend):
     """Check permissions from TenantRole via TenantMembership."""
@@ -14,56 +62,45 @@ class TenantRolePermissionBackend(BaseBackend):
     def authenticate(self, request, **kwargs):
         return None
 
-    def get_user_permissions(self, user_obj: User, obj=None) -> set[str]:
+    def get_user_permissions(self, user_obj: User, obj=None) -> frozenset[str]:
         if not user_obj.is_active or user_obj.is_anonymous:
-            return set()
+            return _NO_PERMISSIONS
 
         if user_obj.is_superuser:
-            return self._get_all_permissions()
+            return all_permissions()
 
         tenant = getattr(connection, 'tenant', None)
         if not tenant or not hasattr(tenant, 'id') or tenant.schema_name == 'public':
-            return set()
+            return _NO_PERMISSIONS
 
         try:
-            from tenants_core.users.models import TenantMembership
-            membership = TenantMembership.objects.get(
-                user=user_obj,
-                tenant_id=tenant.id,
-                is_active=True
-            )
+            membership = get_active_membership(user_obj, tenant.id)
+            if membership is None:
+                return _NO_PERMISSIONS
 
             if membership.tenant_role and membership.tenant_role.is_active:
                 return self._format_permissions(membership.tenant_role.permissions or [])
 
             return self._format_permissions(membership.permissions or [])
 
-        except TenantMembership.DoesNotExist:
-            return set()
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(
-                f"Error getting permissions for user {user_obj.id}: {e}"
-            )
-            return set()
+            logger.warning("Error getting permissions for user %s: %s", user_obj.id, e)
+            return _NO_PERMISSIONS
 
-    def _format_permissions(self, permission_codenames: list) -> set[str]:
+    def _format_permissions(self, permission_codenames: list) -> frozenset[str]:
         if not permission_codenames:
-            return set()
+            return _NO_PERMISSIONS
 
-        from django_tenants.utils import schema_context
+        labels = codename_app_labels()
+        return frozenset(
+            f"{app_label}.{codename}"
+            for codename in permission_codenames
+            for app_label in labels.get(codename, ())
+        )
 
-        with schema_context('public'):
-            permissions = Permission.objects.filter(
-                codename__in=permission_codenames
-            ).select_related('content_type').values_list(
-                'content_type__app_label', 'codename'
-            )
-            return {f"{app_label}.{codename}" for app_label, codename in permissions}
-
-    def get_all_permissions(self, user_obj: User, obj=None) -> set[str]:
+    def get_all_permissions(self, user_obj: User, obj=None) -> frozenset[str]:
         if not user_obj.is_active or user_obj.is_anonymous:
-            return set()
+            return _NO_PERMISSIONS
 
         if not hasattr(user_obj, '_tenant_perm_cache'):
             user_obj._tenant_perm_cache = self.get_user_permissions(user_obj)
@@ -77,8 +114,52 @@ class TenantRolePermissionBackend(BaseBackend):
         if user_obj.is_superuser:
             return True
 
+        # With no membership cached (on the user or in the Django cache), the first
+        # check of a request is answered with one EXISTS; only later checks pay for
+        # loading it. A cached membership answers every check, so they all agree.
+        if not hasattr(user_obj, '_tenant_perm_cache') and not hasattr(user_obj, '_tenant_perm_checked'):
+            tenant = getattr(connection, 'tenant', None)
+            if (
+                tenant is not None
+                and getattr(tenant, 'id', None)
+                and tenant.schema_name != 'public'
+                and get_cached_membership(user_obj, tenant.id) is NOT_CACHED
+            ):
+                user_obj._tenant_perm_checked = True
+                return self._has_single_perm(user_obj, perm)
+
         return perm in self.get_all_permissions(user_obj)
 
+    def _has_single_perm(self, user_obj: User, perm: str) -> bool:
+        """Same answer as ``perm in get_user_permissions()`` without building the set."""
+        app_label, _, codename = perm.partition('.')
+        if app_label not in codename_app_labels().get(codename, ()):
+            return False
+
+        tenant = getattr(connection, 'tenant', None)
+        if not tenant or not hasattr(tenant, 'id') or tenant.schema_name == 'public':
+            return False
+
+        from tenants_core.users.models import TenantMembership
+
+        # Active role grants, or the legacy per-membership permissions when the role
+        # is missing/inactive. Those are a {"codename": ...} object, read by key like
+        # get_user_permissions() does; has_key (jsonb ?) also matches array elements
+        granted = Q(tenant_role__is_active=True, tenant_role__permissions__contains=[codename]) | (
+            (Q(tenant_role__isnull=True) | Q(tenant_role__is_active=False))
+            & Q(permissions__has_key=codename)
+        )
+        try:
+            return TenantMembership.objects.filter(
+                granted,
+                user=user_obj,
+                tenant_id=tenant.id,
+                is_active=True,
+            ).exists()
+        except Exception as e:
+            logger.warning("Error checking permission %s for user %s: %s", perm, user_obj.id, e)
+            return False
+
     def has_module_perms(self, user_obj: User, app_label: str) -> bool:
         if not user_obj.is_active or user_obj.is_anonymous:
             return False
@@ -86,14 +167,12 @@ class TenantRolePermissionBackend(BaseBackend):
         if user_obj.is_superuser:
             return True
 
-        perms = self.get_all_permissions(user_obj)
-        return any(perm.startswith(f"{app_label}.") for perm in perms)
-
-    def _get_all_permissions(self) -> set[str]:
-        return {
-            f"{p.content_type.app_label}.{p.codename}"
-            for p in Permission.objects.select_related('content_type').all()
-        }
+        # App labels of the user's permissions, derived once from the cached set
+        if not hasattr(user_obj, '_tenant_module_cache'):
+            user_obj._tenant_module_cache = frozenset(
+                perm.partition('.')[0] for perm in self.get_all_permissions(user_obj)
+            )
+        return app_label in user_obj._tenant_module_cache
 
     def get_user_role(self, user_obj: User) -> TenantRole | None:
         if not user_obj.is_active or user_obj.is_anonymous:
@@ -103,13 +182,6 @@ class TenantRolePermissionBackend(BaseBackend):
         if not tenant:
             return None
 
-        try:
-            from tenants_core.users.models import TenantMembership
-            membership = TenantMembership.objects.get(
-                user=user_obj,
-                tenant_id=tenant.id,
-                is_active=True
-            )
-            return membership.tenant_role
-        except TenantMembership.DoesNotExist:
-            return None
+        # Shares the per-request (and cross-request) lookup with the admin middleware
+        membership = get_active_membership(user_obj, tenant.id)
+        return membership.tenant_role if membership is not None else None
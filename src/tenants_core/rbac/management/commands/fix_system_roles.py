@@ -10,9 +10,12 @@ Usage:
 """
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.utils import timezone
 from tenants_core.tenant.models import Tenant
 from tenants_core.rbac.models import TenantRole
-from tenants_core.rbac.signals import SYSTEM_ROLES_CONFIG
+from tenants_core.rbac.signals import SYSTEM_ROLES_CONFIG, SYSTEM_ROLES_PERM_SETS
+from tenants_core.users.memberships import invalidate_memberships
+from tenants_core.users.models import TenantMembership
 
 
 class Command(BaseCommand):
@@ -36,8 +39,9 @@ class Command(BaseCommand):
         self.stdout.write('=' * 80)
 
         # Get all tenants
-        tenants = Tenant.objects.all().order_by('created_at')
-        total_tenants = tenants.count()
+        # One SELECT, counted in Python instead of a separate COUNT(*)
+        tenants = list(Tenant.objects.order_by('created_at').only('id', 'name', 'schema_name'))
+        total_tenants = len(tenants)
 
         self.stdout.write(f'\nFound {total_tenants} tenant(s) to process\n')
 
@@ -45,74 +49,113 @@ class Command(BaseCommand):
         total_skipped = 0
         total_errors = 0
 
+        # Every system role in one query instead of one lookup per tenant and role;
+        # plain dicts, since only the id and permissions are read
+        roles_by_key = {
+            (role['tenant_id'], role['name']): role
+            for role in TenantRole.objects.filter(
+                is_system=True, name__in=list(SYSTEM_ROLES_CONFIG)
+            ).values('id', 'tenant_id', 'name', 'permissions')
+        }
+        # Every tenant gets the same values for a role, so one UPDATE per role name
+        dirty_ids = {role_name: [] for role_name in SYSTEM_ROLES_CONFIG}
+        total_dirty = 0
+
         for i, tenant in enumerate(tenants, 1):
-            self.stdout.write(f'\n[{i}/{total_tenants}] Processing tenant: {tenant.name} ({tenant.schema_name})')
-            self.stdout.write('-' * 80)
+            # One write per tenant instead of one per line
+            lines = []
+            write = lines.append
+            write(f'\n[{i}/{total_tenants}] Processing tenant: {tenant.name} ({tenant.schema_name})')
+            write('-' * 80)
 
             updated_count = 0
 
             for role_name, role_config in SYSTEM_ROLES_CONFIG.items():
                 try:
                     # Find the system role for this tenant
-                    role = TenantRole.objects.filter(
-                        tenant_id=tenant.id,
-                        name=role_name,
-                        is_system=True
-                    ).first()
+                    role = roles_by_key.get((tenant.id, role_name))
 
                     if not role:
-                        self.stdout.write(
+                        write(
                             self.style.WARNING(f'  [!] Role "{role_name}" not found - skipping')
                         )
                         total_skipped += 1
                         continue
 
                     # Check if permissions need updating
-                    current_perms = set(role.permissions or [])
-                    new_perms = set(role_config['permissions'])
+                    current_perms = frozenset(role['permissions'] or ())
+                    new_perms = SYSTEM_ROLES_PERM_SETS[role_name]
 
                     if current_perms == new_perms:
-                        self.stdout.write(f'  [OK] {role_name}: Already up to date')
+                        write(f'  [OK] {role_name}: Already up to date')
                         continue
 
                     # Calculate changes
                     added = new_perms - current_perms
                     removed = current_perms - new_perms
 
-                    self.stdout.write(f'  [UPDATE] {role_name}:')
-                    self.stdout.write(f'    Current: {len(current_perms)} permissions')
-                    self.stdout.write(f'    New:     {len(new_perms)} permissions')
+                    write(f'  [UPDATE] {role_name}:')
+                    write(f'    Current: {len(current_perms)} permissions')
+                    write(f'    New:     {len(new_perms)} permissions')
 
                     if added:
-                        self.stdout.write(self.style.SUCCESS(f'    Added:   {len(added)} permissions'))
+                        write(self.style.SUCCESS(f'    Added:   {len(added)} permissions'))
                         for perm in sorted(added):
-                            self.stdout.write(f'             + {perm}')
+                            write(f'             + {perm}')
 
                     if removed:
-                        self.stdout.write(self.style.WARNING(f'    Removed: {len(removed)} permissions'))
+                        write(self.style.WARNING(f'    Removed: {len(removed)} permissions'))
                         for perm in sorted(removed):
-                            self.stdout.write(f'             - {perm}')
+                            write(f'             - {perm}')
 
                     if not dry_run:
-                        with transaction.atomic():
-                            role.permissions = role_config['permissions']
-                            role.description = role_config['description']
-                            role.save()
-                        self.stdout.write(self.style.SUCCESS('    [SAVED]'))
+                        dirty_ids[role_name].append(role['id'])
+                        total_dirty += 1
+                        write(self.style.SUCCESS('    [QUEUED]'))
                     else:
-                        self.stdout.write(self.style.WARNING('    [DRY RUN - NOT SAVED]'))
+                        write(self.style.WARNING('    [DRY RUN - NOT SAVED]'))
 
                     updated_count += 1
                     total_updated += 1
 
                 except Exception as e:
-                    self.stdout.write(
+                    write(
                         self.style.ERROR(f'  [ERROR] Failed to update {role_name}: {str(e)}')
                     )
                     total_errors += 1
 
             if updated_count == 0:
-                self.stdout.write(self.style.SUCCESS(f'  All roles up to date for {tenant.name}'))
+                write(self.style.SUCCESS(f'  All roles up to date for {tenant.name}'))
+
+            self.stdout.write('\n'.join(lines))
+
+        if total_dirty:
+            try:
+                with transaction.atomic():
+                    # update() skips auto_now, so set updated_at explicitly
+                    now = timezone.now()
+                    for role_name, ids in dirty_ids.items():
+                        if ids:
+                            role_config = SYSTEM_ROLES_CONFIG[role_name]
+                            TenantRole.objects.filter(id__in=ids).update(
+                                permissions=role_config['permissions'],
+                                description=role_config['description'],
+                                updated_at=now,
+                            )
+            except Exception as e:
+                self.stdout.write(
+                    self.style.ERROR(f'\n[ERROR] Failed to save {total_dirty} updated role(s): {str(e)}')
+                )
+                total_errors += total_dirty
+                total_updated -= total_dirty
+            else:
+                self.stdout.write(self.style.SUCCESS(f'\n[SAVED] {total_dirty} role(s)'))
+                # update() sends no post_save, so drop cached memberships ourselves
+                invalidate_memberships(
+                    TenantMembership.objects.filter(
+                        tenant_role_id__in=[role_id for ids in dirty_ids.values() for role_id in ids]
+                    ).values_list('user_id', 'tenant_id')
+                )
 
         # Summary
         self.stdout.write('\n' + '=' * 80)
@@ -5,10 +5,31 @@ import uuid
 
 from django.contrib.auth.models import Permission
 from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+from django.utils.functional import cached_property
 
 from .managers import TenantRoleManager
 
 
+class _PermissionsAttribute(DeferredAttribute):
+    """Field descriptor that drops the role's derived permission caches on assignment."""
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+        instance._clear_permission_caches()
+
+
+class _PermissionsField(models.JSONField):
+    """JSONField whose assignments (including refresh_from_db) reset cached lookups."""
+
+    descriptor_class = _PermissionsAttribute
+
+    def deconstruct(self):
+        # Same column as a plain JSONField; keep migrations pointing at it
+        name, _path, args, kwargs = super().deconstruct()
+        return name, "django.db.models.JSONField", args, kwargs
+
+
 class TenantRole(models.Model):
     """
     Role model for tenant-specific permissions.
@@ -50,7 +71,7 @@ class TenantRole(models.Model):
 
     # Store Django permission codenames as JSON array
     # e.g., ["add_service", "change_service", "view_booking"]
-    permissions = models.JSONField(
+    permissions = _PermissionsField(
         default=list,
         help_text="Array of Django permission codenames this role grants"
     )
@@ -99,7 +120,14 @@ class TenantRole(models.Model):
     def get_permission_objects(self):
         """
         Get Django Permission objects for this role's permission codenames.
+
+        The same lazy QuerySet is returned for the life of the instance (until
+        ``permissions`` changes), so once evaluated, repeat calls reuse its rows.
         """
+        return self._permission_objects
+
+    @cached_property
+    def _permission_objects(self):
         if not self.permissions:
             return Permission.objects.none()
         return Permission.objects.filter(codename__in=self.permissions)
@@ -111,39 +139,61 @@ class TenantRole(models.Model):
         Args:
             permission_codename: String like 'add_service' or 'change_booking'
         """
-        return permission_codename in self.permissions
+        return permission_codename in self.permission_set
+
+    @cached_property
+    def permission_set(self):
+        """
+        Permission codenames as a frozenset, built once per instance.
+
+        Reset whenever ``permissions`` is assigned (including refresh_from_db)
+        and by add_permission/remove_permission.
+        """
+        return frozenset(self.permissions or ())
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Pickling a QuerySet evaluates it; roles are cached with memberships
+        state.pop("_permission_objects", None)
+        return state
+
+    def _clear_permission_caches(self):
+        self.__dict__.pop("permission_set", None)
+        self.__dict__.pop("_permission_objects", None)
 
     def add_permission(self, permission_codename):
         """Add a permission to this role."""
         if permission_codename not in self.permissions:
             self.permissions.append(permission_codename)
+            self._clear_permission_caches()
             self.save(update_fields=["permissions", "updated_at"])
 
     def remove_permission(self, permission_codename):
         """Remove a permission from this role."""
         if permission_codename in self.permissions:
             self.permissions.remove(permission_codename)
+            self._clear_permission_caches()
             self.save(update_fields=["permissions", "updated_at"])
 
     def save(self, *args, **kwargs):
         """
         Validate that system roles maintain their integrity.
         """
-        if self.pk:  # Updating existing role
-            try:
-                old_role = TenantRole.objects.get(pk=self.pk)
-                if old_role.is_system:
-                    # Prevent changing role_type of system roles
-                    if old_role.role_type != self.role_type:
-                        raise ValueError(
-                            f"Cannot change role_type of system role '{old_role.name}'"
-                        )
-                    # System roles cannot be deactivated
-                    if not self.is_active and old_role.is_active:
-                        raise ValueError(
-                            f"Cannot deactivate system role '{old_role.name}'"
-                        )
-            except TenantRole.DoesNotExist:
-                pass
+        # pk has a default, so it is set on new instances too: use _state.adding
+        if not self._state.adding:  # Updating existing role
+            old_role = TenantRole.objects.filter(pk=self.pk).values(
+                "name", "role_type", "is_system", "is_active"
+            ).first()
+            if old_role and old_role["is_system"]:
+                # Prevent changing role_type of system roles
+                if old_role["role_type"] != self.role_type:
+                    raise ValueError(
+                        f"Cannot change role_type of system role '{old_role['name']}'"
+                    )
+                # System roles cannot be deactivated
+                if not self.is_active and old_role["is_active"]:
+                    raise ValueError(
+                        f"Cannot deactivate system role '{old_role['name']}'"
+                    )
 
         super().save(*args, **kwargs)
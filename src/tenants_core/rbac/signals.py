@@ -4,8 +4,8 @@ Signals for RBAC app.
 Automatically creates system roles when new tenants are created.
 """
 import logging
-import uuid
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_migrate, post_save
 from django.dispatch import receiver
 
 logger = logging.getLogger(__name__)
@@ -101,6 +101,13 @@ SYSTEM_ROLES_CONFIG = {
 }
 
 
+# Permission lists as sets, built once for comparisons against stored roles
+SYSTEM_ROLES_PERM_SETS = {
+    role_name: frozenset(role_config['permissions'])
+    for role_name, role_config in SYSTEM_ROLES_CONFIG.items()
+}
+
+
 @receiver(post_save, sender='tenant.Tenant')
 def create_system_roles_for_new_tenant(sender, instance, created, **kwargs):
     """
@@ -117,48 +124,62 @@ def create_system_roles_for_new_tenant(sender, instance, created, **kwargs):
         # Only run for new tenants
         return
 
+    # Inserted once the tenant's transaction commits, keeping them out of the
+    # signup request's transaction; outside a transaction this runs at once
+    tenant_id, tenant_name = instance.id, instance.name
+    transaction.on_commit(lambda: _create_system_roles(tenant_id, tenant_name))
+
+
+def _create_system_roles(tenant_id, tenant_name):
+    """Insert any missing system roles for a tenant."""
     # Avoid circular import
     from .models import TenantRole
 
-    tenant = instance
-    logger.info(f"Creating system roles for new tenant: {tenant.name} (ID: {tenant.id})")
-
-    roles_created = []
-
-    for role_name, role_config in SYSTEM_ROLES_CONFIG.items():
-        try:
-            # Check if role already exists (shouldn't happen, but be safe)
-            existing = TenantRole.objects.filter(
-                tenant_id=tenant.id,
-                name=role_name
-            ).exists()
-
-            if existing:
-                logger.warning(f"  Role '{role_name}' already exists for tenant {tenant.id}, skipping")
-                continue
-
-            # Create the role
-            role = TenantRole.objects.create(
-                id=uuid.uuid4(),
-                tenant_id=tenant.id,
-                name=role_name,
-                role_type=role_config['role_type'],
-                description=role_config['description'],
-                permissions=role_config['permissions'],
-                is_system=True,
-                is_active=True,
-            )
-
-            roles_created.append(role_name)
-            logger.info(f"  ✓ Created system role: {role_name} ({len(role_config['permissions'])} permissions)")
-
-        except Exception as e:
-            logger.error(f"  ✗ Failed to create role '{role_name}' for tenant {tenant.id}: {e}")
-
-    if roles_created:
-        logger.info(
-            f"Successfully created {len(roles_created)} system roles for tenant '{tenant.name}': "
-            f"{', '.join(roles_created)}"
+    logger.info(f"Creating system roles for new tenant: {tenant_name} (ID: {tenant_id})")
+
+    roles = [
+        TenantRole(
+            tenant_id=tenant_id,
+            name=role_name,
+            role_type=role_config['role_type'],
+            description=role_config['description'],
+            permissions=role_config['permissions'],
+            is_system=True,
+            is_active=True,
         )
-    else:
-        logger.warning(f"No system roles were created for tenant '{tenant.name}'")
+        for role_name, role_config in SYSTEM_ROLES_CONFIG.items()
+    ]
+
+    try:
+        # One INSERT ... ON CONFLICT DO NOTHING; unique (tenant_id, name) skips any
+        # role that already exists instead of checking each one first
+        TenantRole.objects.bulk_create(roles, ignore_conflicts=True)
+    except Exception as e:
+        logger.error(f"  ✗ Failed to create system roles for tenant {tenant_id}: {e}")
+        return
+
+    logger.info(
+        f"Ensured {len(roles)} system roles for tenant '{tenant_name}': "
+        f"{', '.join(SYSTEM_ROLES_CONFIG)}"
+    )
+
+
+@receiver(post_save, sender='rbac.TenantRole')
+def invalidate_cached_role_memberships(sender, instance, created, **kwargs):
+    """Drop cached memberships carrying this role so permission changes apply at once."""
+    if created:
+        return
+
+    from tenants_core.users.memberships import invalidate_memberships
+
+    pairs = list(instance.memberships.values_list('user_id', 'tenant_id'))
+    transaction.on_commit(lambda: invalidate_memberships(pairs))
+
+
+@receiver(post_migrate)
+def clear_permission_caches(sender, **kwargs):
+    """Permissions may have been added or removed; rebuild the lookups on next use."""
+    from .backends import all_permissions, codename_app_labels
+
+    codename_app_labels.cache_clear()
+    all_permissions.cache_clear()
@@ -3,10 +3,13 @@ Tenant admin interface.
 """
 from django.conf import settings
 from django.contrib import admin
+from django.db.models import Prefetch
 from django.utils.html import format_html
 
 from .models import Domain, Tenant, TenantConfig, TenantLifecycle
 
+OPEN_ADMIN_LINK = '<a href="{}" target="_blank" rel="noopener">Open admin</a>'
+
 
 # NOTE: Tenant is NOT registered with default admin.site
 # It's only registered with public_admin_site in admin_site.py
@@ -25,6 +28,8 @@ class TenantAdmin(admin.ModelAdmin):
     list_filter = ["app_type", "status", "subscription_tier", "created_at"]
     search_fields = ["name", "schema_name", "primary_domain", "contact_email"]
     readonly_fields = ["schema_name", "created_at", "updated_at"]
+    # Protocol for the "Open admin" links, resolved once instead of per row
+    admin_link_scheme = "http" if settings.DEBUG else "https"
     fieldsets = (
         (
             "Basic Information",
@@ -74,6 +79,16 @@ class TenantAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        # open_admin falls back to the tenant's domains; load them for the whole page in one query
+        return super().get_queryset(request).prefetch_related(
+            Prefetch(
+                "domains",
+                queryset=Domain.objects.order_by("-is_primary"),
+                to_attr="ordered_domains",
+            )
+        )
+
     def get_readonly_fields(self, request, obj=None):
         readonly = list(super().get_readonly_fields(request, obj))
         if not obj:
@@ -97,23 +112,18 @@ class TenantAdmin(admin.ModelAdmin):
         """
         Renders a link to open the tenant's Django admin. Assumes tenant admin is at /admin/.
         """
-        # Prefer explicit primary_domain; fallback to the first related Domain if available
-        domain = getattr(obj, "primary_domain", None)
+        # Prefer explicit primary_domain; fallback to the primary (or first) related Domain
+        domain = obj.primary_domain
         if not domain:
-            try:
-                domain = obj.domains.filter(is_primary=True).first() or obj.domains.first()
-                domain = domain.domain if domain else None
-            except Exception:
-                domain = None
+            domains = getattr(obj, "ordered_domains", None)
+            if domains is None:
+                domains = list(obj.domains.order_by("-is_primary")[:1])
+            domain = domains[0].domain if domains else None
 
         if not domain:
             return "—"
 
-        # Determine protocol
-        use_https = not getattr(settings, "DEBUG", False)
-        proto = "https" if use_https else "http"
-        url = f"{proto}://{domain}/admin/"
-        return format_html('<a href="{}" target="_blank" rel="noopener">Open admin</a>', url)
+        return format_html(OPEN_ADMIN_LINK, f"{self.admin_link_scheme}://{domain}/admin/")
 
     open_admin.short_description = "Tenant Admin"
 
@@ -121,6 +131,7 @@ class TenantAdmin(admin.ModelAdmin):
 # Domain should only be managed in public admin
 class DomainAdmin(admin.ModelAdmin):
     list_display = ["domain", "tenant", "is_primary"]
+    list_select_related = ["tenant"]
     list_filter = ["is_primary"]
     search_fields = ["domain", "tenant__name"]
 
@@ -128,6 +139,7 @@ class DomainAdmin(admin.ModelAdmin):
 # TenantConfig should only be managed in public admin
 class TenantConfigAdmin(admin.ModelAdmin):
     list_display = ["tenant", "category", "key", "is_encrypted", "updated_at"]
+    list_select_related = ["tenant"]
     list_filter = ["category", "is_encrypted"]
     search_fields = ["tenant__name", "key"]
     readonly_fields = ["created_at", "updated_at"]
@@ -136,6 +148,7 @@ class TenantConfigAdmin(admin.ModelAdmin):
 # TenantLifecycle should only be managed in public admin
 class TenantLifecycleAdmin(admin.ModelAdmin):
     list_display = ["tenant", "event", "performed_by", "occurred_at"]
+    list_select_related = ["tenant"]
     list_filter = ["event", "occurred_at"]
     search_fields = ["tenant__name", "performed_by"]
     readonly_fields = ["occurred_at"]
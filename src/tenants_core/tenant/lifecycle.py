@@ -0,0 +1,61 @@
+"""
+Buffered writes for TenantLifecycle audit rows.
+
+Tenant signals record lifecycle events through ``record_lifecycle_event``. Inside a
+``TenantLifecycleRecorder`` block the rows are collected and written with one
+``bulk_create`` when the block exits, instead of one INSERT per event.
+
+Every write uses ON CONFLICT DO NOTHING: a duplicate "created" event (see the
+``uniq_tenant_lifecycle_created`` constraint) is dropped by PostgreSQL.
+"""
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import TenantLifecycle
+
+_buffer: ContextVar[list | None] = ContextVar("tenant_lifecycle_buffer", default=None)
+
+
+def record_lifecycle_event(**fields) -> None:
+    """Create a TenantLifecycle row now, or queue it if a recorder is active."""
+    event = TenantLifecycle(**fields)
+    buffer = _buffer.get()
+    if buffer is None:
+        TenantLifecycle.objects.bulk_create([event], ignore_conflicts=True)
+    else:
+        buffer.append(event)
+
+
+class TenantLifecycleRecorder:
+    """
+    Context manager batching lifecycle events recorded inside it.
+
+    Use it inside the caller's transaction so the flush commits (or rolls back)
+    with the tenant changes. Events are dropped if the block raises. Nested
+    recorders share the outermost buffer. All events of one flush get the same
+    occurred_at, so the rows of one operation sort and group together.
+    """
+
+    def __enter__(self):
+        self._token = None
+        if _buffer.get() is None:
+            self._token = _buffer.set([])
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._token is None:
+            return False
+        events = _buffer.get()
+        _buffer.reset(self._token)
+        if exc_type is None and events:
+            occurred_at = timezone.now()
+            for event in events:
+                event.occurred_at = occurred_at
+            TenantLifecycle.objects.bulk_create(
+                events,
+                batch_size=getattr(settings, "TENANT_LIFECYCLE_BATCH_SIZE", 1000),
+                ignore_conflicts=True,
+            )
+        return False
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:42
+
+import tenants_core.core.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenant', '0006_regenerate_proper_uuids'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tenantlifecycle',
+            name='metadata',
+            field=tenants_core.core.fields.OrjsonJSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenant', '0007_lifecycle_metadata_orjson'),
+    ]
+
+    operations = [
+        # Keep the earliest row of any duplicates written before the constraint existed
+        migrations.RunSQL(
+            """
+            DELETE FROM tenant_lifecycle a
+            USING tenant_lifecycle b
+            WHERE a.tenant_id = b.tenant_id
+              AND a.event = b.event
+              AND a.event = 'created'
+              AND a.id > b.id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='tenantlifecycle',
+            constraint=models.UniqueConstraint(condition=models.Q(('event', 'created')), fields=('tenant', 'event'), name='uniq_tenant_lifecycle_created'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-16 02:44
+
+import django.db.models.functions.datetime
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenant', '0008_lifecycle_created_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tenantlifecycle',
+            name='occurred_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), default=django.utils.timezone.now, editable=False),
+        ),
+    ]
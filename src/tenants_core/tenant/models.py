@@ -4,8 +4,12 @@ Tenant models for multi-tenant schema isolation.
 import uuid
 
 from django.db import models
+from django.db.models.functions import Now
+from django.utils import timezone
 from django_tenants.models import DomainMixin, TenantMixin
 
+from tenants_core.core.fields import OrjsonJSONField
+
 
 class Tenant(TenantMixin):
     """
@@ -190,8 +194,10 @@ class TenantLifecycle(models.Model):
     )
     event = models.CharField(max_length=50, choices=LifecycleEvent.choices, db_index=True)
     performed_by = models.CharField(max_length=255, blank=True)  # User ID or "system"
-    metadata = models.JSONField(default=dict, blank=True)
-    occurred_at = models.DateTimeField(auto_now_add=True)
+    metadata = OrjsonJSONField(default=dict, blank=True)
+    # A recorder flush stamps all of its rows with one timestamp; the database
+    # default covers inserts made outside the ORM
+    occurred_at = models.DateTimeField(default=timezone.now, db_default=Now(), editable=False)
 
     class Meta:
         db_table = "tenant_lifecycle"
@@ -200,6 +206,16 @@ class TenantLifecycle(models.Model):
             models.Index(fields=["tenant", "event"]),
             models.Index(fields=["occurred_at"]),
         ]
+        constraints = [
+            # A tenant is created once; writers insert with ON CONFLICT DO
+            # NOTHING so racing signals cannot duplicate the row. Deletion rows
+            # have tenant=NULL (SET_NULL), which a unique index never matches.
+            models.UniqueConstraint(
+                fields=["tenant", "event"],
+                condition=models.Q(event="created"),
+                name="uniq_tenant_lifecycle_created",
+            ),
+        ]
 
     def __str__(self):
         if self.tenant is not None:
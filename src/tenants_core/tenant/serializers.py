@@ -9,6 +9,10 @@ from .models import Tenant
 class TenantRegistrationSerializer(serializers.Serializer):
     """Serializer for tenant registration."""
 
+    RESERVED_SUBDOMAINS = frozenset(
+        {"www", "api", "admin", "app", "mail", "ftp", "localhost", "staging"}
+    )
+
     name = serializers.CharField(max_length=255)
     subdomain = serializers.SlugField(max_length=63)
     contact_email = serializers.EmailField()
@@ -16,16 +20,17 @@ class TenantRegistrationSerializer(serializers.Serializer):
 
     def validate_subdomain(self, value):
         """Validate subdomain uniqueness and format."""
+        value = value.lower()
+
+        # Reserved subdomains (checked first: no query needed)
+        if value in self.RESERVED_SUBDOMAINS:
+            raise serializers.ValidationError("This subdomain is reserved.")
+
         # Check if subdomain already exists
         if Tenant.objects.filter(schema_name=f"tenant_{value}").exists():
             raise serializers.ValidationError("This subdomain is already taken.")
 
-        # Reserved subdomains
-        reserved = ["www", "api", "admin", "app", "mail", "ftp", "localhost", "staging"]
-        if value.lower() in reserved:
-            raise serializers.ValidationError("This subdomain is reserved.")
-
-        return value.lower()
+        return value
 
 
 class TenantSerializer(serializers.ModelSerializer):
@@ -2,17 +2,32 @@
 Tenant signals for lifecycle management and automation.
 """
 from django.conf import settings
-from django.db.models.signals import post_save, pre_delete
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
+from tenants_core.core.host_validation import DOMAIN_CHANGED_CHANNEL, invalidate_allowed_hosts_cache
+
+from .lifecycle import record_lifecycle_event
 from .models import Domain, Tenant, TenantLifecycle
 
 
+@receiver(pre_save, sender=Tenant)
+def normalize_primary_domain(sender, instance, **kwargs):
+    """Expand a bare subdomain (e.g., "acme") using TENANT_BASE_DOMAIN before the first INSERT."""
+    if not instance._state.adding or not getattr(settings, "TENANT_AUTO_CREATE_PRIMARY_DOMAIN", True):
+        return
+    primary = instance.primary_domain
+    if primary and "." not in primary:
+        base = getattr(settings, "TENANT_BASE_DOMAIN", "localhost")
+        instance.primary_domain = f"{primary}.{base}"
+
+
 @receiver(post_save, sender=Tenant)
 def log_tenant_creation(sender, instance, created, **kwargs):
     """Log tenant creation event."""
     if created:
-        TenantLifecycle.objects.create(
+        record_lifecycle_event(
             tenant=instance,
             event=TenantLifecycle.LifecycleEvent.CREATED,
             performed_by="system",
@@ -20,31 +35,21 @@ def log_tenant_creation(sender, instance, created, **kwargs):
         )
 
         # Auto-create primary Domain if configured and missing
-        if getattr(settings, "TENANT_AUTO_CREATE_PRIMARY_DOMAIN", True):
-            primary = instance.primary_domain
-
-            # If admin set a bare subdomain (e.g., "acme"), expand using TENANT_BASE_DOMAIN
-            if primary and "." not in primary:
-                base = getattr(settings, "TENANT_BASE_DOMAIN", "localhost")
-                primary = f"{primary}.{base}"
-
-            if primary:
-                # Persist any normalization back to tenant if needed
-                if primary != instance.primary_domain:
-                    Tenant.objects.filter(pk=instance.pk).update(primary_domain=primary)
-                    instance.primary_domain = primary
-
-                # Ensure a Domain exists and mark it primary
-                Domain.objects.get_or_create(
-                    domain=primary,
-                    defaults={"tenant": instance, "is_primary": True},
-                )
+        # (primary_domain was already normalized in normalize_primary_domain)
+        if getattr(settings, "TENANT_AUTO_CREATE_PRIMARY_DOMAIN", True) and instance.primary_domain:
+            # Single INSERT ... ON CONFLICT DO NOTHING instead of get_or_create's SELECT + INSERT
+            Domain.objects.bulk_create(
+                [Domain(domain=instance.primary_domain, tenant=instance, is_primary=True)],
+                ignore_conflicts=True,
+            )
+            # bulk_create sends no post_save, so notify the host caches ourselves
+            notify_domain_changed(sender=Domain, instance=None)
 
 
 @receiver(pre_delete, sender=Tenant)
 def log_tenant_deletion(sender, instance, **kwargs):
     """Log tenant deletion event."""
-    TenantLifecycle.objects.create(
+    record_lifecycle_event(
         tenant=None,  # Avoid FK issues during deletion; keep identifiers in metadata
         event=TenantLifecycle.LifecycleEvent.DELETED,
         performed_by="system",
@@ -54,3 +59,15 @@ def log_tenant_deletion(sender, instance, **kwargs):
             "primary_domain": getattr(instance, "primary_domain", None),
         },
     )
+
+
+@receiver(post_save, sender=Domain)
+@receiver(post_delete, sender=Domain)
+def notify_domain_changed(sender, instance, **kwargs):
+    """Tell every worker to drop its cached allowed-hosts set.
+
+    PostgreSQL only delivers the NOTIFY once the surrounding transaction commits.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"NOTIFY {DOMAIN_CHANGED_CHANNEL}")
+    transaction.on_commit(invalidate_allowed_hosts_cache)
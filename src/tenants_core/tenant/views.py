@@ -7,6 +7,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .lifecycle import TenantLifecycleRecorder
 from .models import Domain, Tenant
 from .serializers import TenantRegistrationSerializer
 
@@ -30,20 +31,23 @@ class TenantRegistrationView(APIView):
         tenant_data = serializer.validated_data
         subdomain = tenant_data.pop("subdomain")
 
-        tenant = Tenant.objects.create(
-            name=tenant_data["name"],
-            schema_name=f"tenant_{subdomain}",
-            contact_email=tenant_data["contact_email"],
-            contact_phone=tenant_data.get("contact_phone", ""),
-            primary_domain=f"{subdomain}.{getattr(settings, 'TENANT_BASE_DOMAIN', 'localhost')}",
-        )
-
-        # Create domain
-        Domain.objects.create(
-            domain=f"{subdomain}.{getattr(settings, 'TENANT_BASE_DOMAIN', 'localhost')}",
-            tenant=tenant,
-            is_primary=True,
-        )
+        schema_name = f"tenant_{subdomain}"
+        domain = f"{subdomain}.{getattr(settings, 'TENANT_BASE_DOMAIN', 'localhost')}"
+
+        # Lifecycle rows written by the tenant signals go out in one INSERT at block exit
+        with TenantLifecycleRecorder():
+            # Tenant.save() creates the schema, so this cannot be a bulk_create
+            tenant = Tenant.objects.create(
+                name=tenant_data["name"],
+                schema_name=schema_name,
+                contact_email=tenant_data["contact_email"],
+                contact_phone=tenant_data.get("contact_phone", ""),
+                primary_domain=domain,
+            )
+
+            # log_tenant_creation already inserts the primary Domain unless disabled
+            if not getattr(settings, "TENANT_AUTO_CREATE_PRIMARY_DOMAIN", True):
+                Domain.objects.create(domain=domain, tenant=tenant, is_primary=True)
 
         return Response(
             {
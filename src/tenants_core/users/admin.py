@@ -14,6 +14,7 @@ from django import forms
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.db import connection
+from django.db.models import OuterRef, Subquery
 
 from tenants_core.tenant.models import Tenant
 
@@ -24,7 +25,8 @@ class TenantMembershipAdminForm(forms.ModelForm):
     """Custom form for TenantMembership with tenant dropdown."""
 
     tenant = forms.ModelChoiceField(
-        queryset=Tenant.objects.all().order_by('name'),
+        # Only the columns used by the choice labels and clean()
+        queryset=Tenant.objects.only('id', 'name', 'schema_name').order_by('name'),
         required=True,
         help_text="Select the tenant for this membership"
     )
@@ -48,13 +50,11 @@ class TenantMembershipAdminForm(forms.ModelForm):
         self.fields['role_name'].choices = role_choices
 
         # Pre-populate from instance
+        # ModelChoiceField accepts a pk as initial, so no Tenant lookup is needed
         if self.instance.pk and self.instance.tenant_id:
-            try:
-                self.initial['tenant'] = Tenant.objects.get(id=self.instance.tenant_id)
-                if self.instance.tenant_role:
-                    self.initial['role_name'] = self.instance.tenant_role.name
-            except Tenant.DoesNotExist:
-                pass
+            self.initial['tenant'] = self.instance.tenant_id
+            if self.instance.tenant_role:
+                self.initial['role_name'] = self.instance.tenant_role.name
 
     def clean(self):
         cleaned_data = super().clean()
@@ -433,6 +433,7 @@ class TenantMembershipAdmin(admin.ModelAdmin):
     """Full membership admin - only for super admins in public admin."""
     form = TenantMembershipAdminForm
     list_display = ["user", "tenant_display", "role_display", "is_active", "joined_at"]
+    list_select_related = ["user", "tenant_role"]
     list_filter = ["is_active", "joined_at"]
     search_fields = ["user__email", "user__first_name", "user__last_name"]
     readonly_fields = ["joined_at", "updated_at"]
@@ -449,14 +450,22 @@ class TenantMembershipAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Annotate tenant name/domain so tenant_display needs no per-row query."""
+        qs = super().get_queryset(request)
+        tenant = Tenant.objects.filter(id=OuterRef("tenant_id")).order_by()
+        return qs.annotate(
+            tenant_name=Subquery(tenant.values("name")[:1]),
+            tenant_primary_domain=Subquery(tenant.values("primary_domain")[:1]),
+        )
+
     def tenant_display(self, obj):
         """Display tenant name and domain."""
-        try:
-            tenant = Tenant.objects.get(id=obj.tenant_id)
-            return f"{tenant.name} ({tenant.primary_domain})"
-        except Tenant.DoesNotExist:
+        if obj.tenant_name is None:
             return str(obj.tenant_id)
+        return f"{obj.tenant_name} ({obj.tenant_primary_domain})"
     tenant_display.short_description = "Tenant"
+    tenant_display.admin_order_field = "tenant_name"
 
     def role_display(self, obj):
         """Display role name."""
@@ -8,7 +8,8 @@ from .models import TenantMembership
 
 class TenantMembershipAdminForm(forms.ModelForm):
     tenant = forms.ModelChoiceField(
-        queryset=Tenant.objects.all().order_by("name"),
+        # Only the columns used by the choice labels
+        queryset=Tenant.objects.only("id", "name", "schema_name").order_by("name"),
         required=True,
         help_text="Select the tenant to link this user to.",
         label="Tenant",
@@ -27,12 +28,10 @@ class TenantMembershipAdminForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Pre-populate tenant dropdown from instance.tenant_id when editing
+        # Pre-populate tenant dropdown from instance.tenant_id when editing;
+        # ModelChoiceField accepts a pk, so no Tenant lookup is needed
         if self.instance and self.instance.pk and self.instance.tenant_id:
-            try:
-                self.fields["tenant"].initial = Tenant.objects.get(id=self.instance.tenant_id)
-            except Tenant.DoesNotExist:
-                pass
+            self.fields["tenant"].initial = self.instance.tenant_id
 
     def save(self, commit=True):
         obj = super().save(commit=False)
@@ -0,0 +1,95 @@
+"""
+Cached lookup of a user's active membership in a tenant.
+
+The tenant admin middleware (on every /admin request) and the RBAC backend both
+need it. Results are kept on the user object for the rest of the request and in
+the Django cache for TENANT_MEMBERSHIP_CACHE_TIMEOUT seconds, keyed by
+(user_id, tenant_id). Signals on TenantMembership and TenantRole drop the
+affected keys when either changes.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import TenantMembership
+
+# Columns the access check and the RBAC backend read; descriptions, metadata
+# and timestamps stay deferred, which also keeps the cached pickle small
+_MEMBERSHIP_FIELDS = (
+    "id",
+    "tenant_id",
+    "user",
+    "role",
+    "permissions",
+    "is_active",
+    "tenant_role__id",
+    "tenant_role__tenant_id",
+    "tenant_role__name",
+    "tenant_role__role_type",
+    "tenant_role__permissions",
+    "tenant_role__is_active",
+)
+
+# Cached in place of None so a miss for a non-member is distinguishable from no entry
+_NOT_A_MEMBER = "-"
+
+
+def membership_cache_key(user_id, tenant_id) -> str:
+    return f"tm:{user_id}:{tenant_id}"
+
+
+# Returned by get_cached_membership when neither cache knows the answer
+NOT_CACHED = object()
+
+
+def get_cached_membership(user, tenant_id):
+    """
+    Return the membership known without a query: from the user, then the Django cache.
+
+    None means a cached non-member; NOT_CACHED means only the database can tell.
+    """
+    memberships = getattr(user, "_tenant_memberships", None)
+    if memberships is None:
+        memberships = user._tenant_memberships = {}
+    if tenant_id in memberships:
+        return memberships[tenant_id]
+
+    membership = cache.get(membership_cache_key(user.pk, tenant_id))
+    if membership is None:
+        return NOT_CACHED
+    if membership == _NOT_A_MEMBER:
+        membership = None
+    else:
+        # Reuse the loaded user instead of fetching it again on access
+        membership.user = user
+    memberships[tenant_id] = membership
+    return membership
+
+
+def get_active_membership(user, tenant_id):
+    """Return the user's active TenantMembership (tenant_role loaded) for tenant_id, or None."""
+    membership = get_cached_membership(user, tenant_id)
+    if membership is not NOT_CACHED:
+        return membership
+
+    membership = (
+        TenantMembership.objects.select_related("tenant_role")
+        .only(*_MEMBERSHIP_FIELDS)
+        .filter(user=user, tenant_id=tenant_id, is_active=True)
+        .first()
+    )
+    cache.set(
+        membership_cache_key(user.pk, tenant_id),
+        membership if membership is not None else _NOT_A_MEMBER,
+        getattr(settings, "TENANT_MEMBERSHIP_CACHE_TIMEOUT", 60),
+    )
+    if membership is not None:
+        membership.user = user
+    user._tenant_memberships[tenant_id] = membership
+    return membership
+
+
+def invalidate_memberships(pairs) -> None:
+    """Drop cached memberships for an iterable of (user_id, tenant_id) pairs."""
+    keys = [membership_cache_key(user_id, tenant_id) for user_id, tenant_id in pairs]
+    if keys:
+        cache.delete_many(keys)
@@ -1,7 +1,9 @@
 """Signals to align user flags with tenant memberships."""
+from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from .memberships import invalidate_memberships
 from .models import TenantMembership, User
 
 
@@ -23,11 +25,19 @@ def _recompute_is_staff(user: User):
         User.objects.filter(pk=user.pk).update(is_staff=False)
 
 
+def _invalidate_cached_membership(membership: TenantMembership):
+    """Drop the cached admin-access lookup once the change is committed."""
+    pair = (membership.user_id, membership.tenant_id)
+    transaction.on_commit(lambda: invalidate_memberships([pair]))
+
+
 @receiver(post_save, sender=TenantMembership)
 def on_membership_saved(sender, instance: TenantMembership, created, **kwargs):
     _recompute_is_staff(instance.user)
+    _invalidate_cached_membership(instance)
 
 
 @receiver(post_delete, sender=TenantMembership)
 def on_membership_deleted(sender, instance: TenantMembership, **kwargs):
     _recompute_is_staff(instance.user)
+    _invalidate_cached_membership(instance)
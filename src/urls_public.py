@@ -2,18 +2,27 @@
 Public URL configuration (non-tenant routes).
 """
 from django.conf import settings
+from django.http import HttpResponse
 from django.urls import include, path
 
 from tenants_core.core.admin_site import public_admin_site
 from tenants_core.tenant.views import TenantRegistrationView
 
+_HEALTH_BODY = b'{"status": "ok"}'
+
+
+def health(request):
+    """Load balancer probe; the body is encoded once at import."""
+    return HttpResponse(_HEALTH_BODY, content_type="application/json")
+
+
 urlpatterns = [
     # Public admin for super admins (manages tenants & shared apps)
     path("admin/", public_admin_site.urls),
     # Tenant registration/provisioning
     path("api/v1/tenants/register/", TenantRegistrationView.as_view(), name="tenant-register"),
     # Health check
-    path("health/", lambda request: __import__("django.http").http.JsonResponse({"status": "ok"})),
+    path("health/", health),
 ]
 
 # Titles are already set on public_admin_site in bookme.core.admin_site
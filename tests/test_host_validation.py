@@ -0,0 +1,91 @@
+"""
+Allowed-host cache in core.host_validation, with the LISTEN thread disabled.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from tenants_core.core import host_validation
+from tenants_core.tenant.models import Domain
+from tenants_core.tenant.signals import notify_domain_changed
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def hosts(settings, monkeypatch):
+    settings.TENANT_DOMAIN_CHANGE_LISTENER = False
+    settings.ALLOWED_HOSTS = [".example.com", "api.local"]
+    clock = _Clock()
+    loads = []
+
+    def load():
+        loads.append(clock.now)
+        return frozenset({"shop.example.org"})
+
+    monkeypatch.setattr(host_validation, "time", clock)
+    monkeypatch.setattr(host_validation, "_load_hosts_from_db", load)
+    monkeypatch.setattr(host_validation, "_listener_started", False)
+    monkeypatch.setattr(host_validation, "_listener_alive", False)
+    host_validation.invalidate_allowed_hosts_cache()
+    yield SimpleNamespace(clock=clock, loads=loads)
+    host_validation.invalidate_allowed_hosts_cache()
+
+
+def test_short_ttl_without_a_listener(hosts):
+    host_validation.host_is_allowed("api.local")
+    hosts.clock.now += host_validation._FALLBACK_CACHE_TTL - 1
+    host_validation.host_is_allowed("api.local")
+    assert len(hosts.loads) == 1
+
+    hosts.clock.now += 2
+    host_validation.host_is_allowed("api.local")
+    assert len(hosts.loads) == 2
+
+
+def test_long_ttl_while_a_listener_is_connected(hosts, monkeypatch):
+    monkeypatch.setattr(host_validation, "_listener_alive", True)
+    host_validation.host_is_allowed("api.local")
+    hosts.clock.now += host_validation._FALLBACK_CACHE_TTL + 1
+    host_validation.host_is_allowed("api.local")
+    assert len(hosts.loads) == 1
+
+    hosts.clock.now += host_validation._CACHE_TTL
+    host_validation.host_is_allowed("api.local")
+    assert len(hosts.loads) == 2
+
+
+@pytest.mark.parametrize(
+    "host, allowed",
+    [
+        ("example.com", True),
+        ("shop.example.com", True),
+        ("a.b.example.com", True),
+        ("api.local", True),
+        ("shop.example.org", True),
+        ("badexample.com", False),
+        ("example.com.evil.net", False),
+        ("sub.api.local", False),
+    ],
+)
+def test_host_is_allowed_matches_exact_names_and_suffixes(hosts, host, allowed):
+    assert host_validation.host_is_allowed(host) is allowed
+
+
+@pytest.mark.django_db
+def test_notify_domain_changed_expires_the_cache(hosts, django_capture_on_commit_callbacks):
+    host_validation.host_is_allowed("api.local")
+    assert len(hosts.loads) == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        notify_domain_changed(sender=Domain, instance=None)
+
+    # Well inside the TTL, yet the next check reloads
+    host_validation.host_is_allowed("api.local")
+    assert len(hosts.loads) == 2
@@ -0,0 +1,82 @@
+"""
+TenantRolePermissionBackend: the single-permission fast path must agree with
+the full permission set.
+"""
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+
+from tenants_core.rbac.backends import TenantRolePermissionBackend, codename_app_labels
+from tenants_core.rbac.models import TenantRole
+from tenants_core.users.memberships import get_active_membership
+from tenants_core.users.models import TenantMembership, User
+
+PERM = "rbac.view_tenantrole"
+CODENAME = "view_tenantrole"
+
+
+@pytest.fixture
+def tenant(monkeypatch):
+    tenant = SimpleNamespace(id=uuid.uuid4(), schema_name="acme")
+    monkeypatch.setattr(connection, "tenant", tenant, raising=False)
+    cache.clear()
+    yield tenant
+    cache.clear()
+
+
+def _fresh_user(pk):
+    # A new instance carries none of the backend's per-request caches
+    return User.objects.get(pk=pk)
+
+
+def _assert_fast_path_matches_full_set(user_pk, perm):
+    backend = TenantRolePermissionBackend()
+    expected = perm in backend.get_all_permissions(_fresh_user(user_pk))
+    cache.clear()
+    # First check of a "request" goes through the EXISTS fast path
+    assert backend.has_perm(_fresh_user(user_pk), perm) is expected
+    return expected
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("role_active", [None, False], ids=["no-role", "inactive-role"])
+def test_legacy_membership_permissions_agree(tenant, role_active):
+    user = User.objects.create_user(email="legacy@example.com", password="x")
+    tenant_role = None
+    if role_active is not None:
+        tenant_role = TenantRole.objects.create(
+            tenant_id=tenant.id, name="Legacy", permissions=[], is_active=role_active
+        )
+    TenantMembership.objects.create(
+        user=user,
+        tenant_id=tenant.id,
+        tenant_role=tenant_role,
+        permissions={CODENAME: True},
+        is_active=True,
+    )
+
+    assert _assert_fast_path_matches_full_set(user.pk, PERM) is True
+    assert _assert_fast_path_matches_full_set(user.pk, "rbac.delete_tenantrole") is False
+
+
+@pytest.mark.django_db
+def test_warm_membership_cache_answers_without_query(tenant, django_assert_num_queries):
+    user = User.objects.create_user(email="member@example.com", password="x")
+    role = TenantRole.objects.create(tenant_id=tenant.id, name="Editor", permissions=[CODENAME])
+    TenantMembership.objects.create(user=user, tenant_id=tenant.id, tenant_role=role, is_active=True)
+    codename_app_labels()
+    # What TenantAdminAccessMiddleware does on an earlier (or the same) request
+    get_active_membership(_fresh_user(user.pk), tenant.id)
+
+    # Changed behind the cache's back: every check must still give the cached answer
+    TenantRole.objects.filter(pk=role.pk).update(permissions=[])
+
+    backend = TenantRolePermissionBackend()
+    request_user = _fresh_user(user.pk)
+    with django_assert_num_queries(0):
+        assert backend.has_perm(request_user, PERM) is True
+        assert backend.has_perm(request_user, PERM) is True
+        assert PERM in backend.get_all_permissions(request_user)
@@ -0,0 +1,93 @@
+"""
+TenantAdminAccessMiddleware: tenant admin is open to active members of the
+request's tenant and closed to everyone else.
+"""
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from tenants_core.core.middleware import TenantAdminAccessMiddleware
+from tenants_core.rbac.models import TenantRole
+from tenants_core.users.models import TenantMembership, User
+
+
+@pytest.fixture
+def tenant():
+    cache.clear()
+    yield SimpleNamespace(id=uuid.uuid4(), schema_name="acme")
+    cache.clear()
+
+
+def _admin_request(user_pk, tenant):
+    request = RequestFactory().get("/admin/")
+    # A new instance per request, as AuthenticationMiddleware would load it
+    request.user = User.objects.get(pk=user_pk)
+    request.tenant = tenant
+    return request
+
+
+def _call(request):
+    return TenantAdminAccessMiddleware(lambda request: HttpResponse("ok"))(request)
+
+
+@pytest.mark.django_db
+def test_active_member_is_allowed(tenant):
+    user = User.objects.create_user(email="member@example.com", password="x")
+    role = TenantRole.objects.create(tenant_id=tenant.id, name="Staff", permissions=[])
+    membership = TenantMembership.objects.create(
+        user=user, tenant_id=tenant.id, tenant_role=role, is_active=True
+    )
+
+    request = _admin_request(user.pk, tenant)
+    response = _call(request)
+
+    assert response.status_code == 200
+    assert request.user_membership.pk == membership.pk
+    assert request.user_role.pk == role.pk
+
+
+@pytest.mark.django_db
+def test_non_member_is_forbidden(tenant):
+    user = User.objects.create_user(email="outsider@example.com", password="x")
+    # A membership elsewhere does not open this tenant's admin
+    TenantMembership.objects.create(user=user, tenant_id=uuid.uuid4(), is_active=True)
+
+    response = _call(_admin_request(user.pk, tenant))
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_deactivated_membership_applies_to_the_next_request(tenant, django_capture_on_commit_callbacks):
+    user = User.objects.create_user(email="leaver@example.com", password="x")
+    membership = TenantMembership.objects.create(user=user, tenant_id=tenant.id, is_active=True)
+    # Allowed, and the membership is now in the cross-request cache
+    assert _call(_admin_request(user.pk, tenant)).status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        membership.is_active = False
+        membership.save()
+
+    assert _call(_admin_request(user.pk, tenant)).status_code == 403
+
+
+@pytest.mark.django_db
+def test_role_change_applies_to_the_next_request(tenant, django_capture_on_commit_callbacks):
+    user = User.objects.create_user(email="editor@example.com", password="x")
+    role = TenantRole.objects.create(tenant_id=tenant.id, name="Editor", permissions=["view_tenantrole"])
+    TenantMembership.objects.create(user=user, tenant_id=tenant.id, tenant_role=role, is_active=True)
+    request = _admin_request(user.pk, tenant)
+    _call(request)
+    assert request.user_role.permissions == ["view_tenantrole"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        role.permissions = []
+        role.save()
+
+    request = _admin_request(user.pk, tenant)
+    _call(request)
+    assert request.user_role.permissions == []